@@ -6,18 +6,40 @@ Provides:
 - DM agent creation
 - Player agent creation with automatic provider rotation
 - Convenience functions for creating full party
+- Async variants that build agents concurrently
 """
 
+import asyncio
+import copy
 import os
 from pathlib import Path
 from typing import Dict, List
 
 import yaml
 
+# Prefer the LibYAML-backed loader (~10x faster); it is available when PyYAML
+# was built against libyaml, e.g. `pip install pyyaml --no-binary pyyaml`
+# with libyaml-dev installed. Falls back to the pure-Python loader otherwise.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+    _HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+    _HAS_LIBYAML = False
+
 from src.agents.dm_agent import create_dm_agent
 from src.agents.player_agent import create_player_agent
 
 
+# Parsed character sheets keyed by (absolute path, mtime in ns)
+# A changed mtime produces a new key, so edited files are re-parsed automatically
+_CHAR_CACHE: Dict[tuple, Dict] = {}
+
+# Sorted YAML entries per directory keyed by (absolute path, dir mtime in ns)
+# Adding/removing files bumps the directory mtime and invalidates the listing
+_DIR_CACHE: Dict[tuple, List[tuple]] = {}
+
+
 def load_character(character_file: str, characters_dir: str = "data/characters") -> Dict:
     """
     Load character sheet from YAML file.
@@ -32,16 +54,47 @@ def load_character(character_file: str, characters_dir: str = "data/characters")
     Raises:
         FileNotFoundError: If character file doesn't exist
         yaml.YAMLError: If file is not valid YAML
+
+    Note:
+        Parsed sheets are cached by (path, mtime); callers always receive a
+        fresh copy, so mutating the result never affects the cache.
     """
     file_path = os.path.join(characters_dir, character_file)
 
-    if not os.path.exists(file_path):
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Character file not found: {file_path}")
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        character = yaml.safe_load(f)
+    return _load_character_file(file_path, st.st_mtime_ns)
+
+
+def _load_character_file(file_path: str, mtime_ns: int) -> Dict:
+    """
+    Parse (or fetch from cache) a character file whose existence is already known.
+
+    Args:
+        file_path: Path to the YAML file
+        mtime_ns: File modification time, used as cache validator
+
+    Returns:
+        Fresh copy of the character sheet dictionary
+    """
+    key = (os.path.abspath(file_path), mtime_ns)
+    cached = _CHAR_CACHE.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    if _HAS_LIBYAML:
+        # libyaml reads and decodes UTF-8 itself - skip Python's text decoder
+        with open(file_path, 'rb') as f:
+            character = yaml.load(f, Loader=_SafeLoader)
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            character = yaml.load(f, Loader=_SafeLoader)
 
-    return character
+    _CHAR_CACHE[key] = character
+    return copy.deepcopy(character)
 
 
 def load_all_characters(characters_dir: str = "data/characters") -> List[Dict]:
@@ -59,12 +112,10 @@ def load_all_characters(characters_dir: str = "data/characters") -> List[Dict]:
     """
     characters = []
 
-    # Get all YAML files in directory
-    yaml_files = sorted([f for f in os.listdir(characters_dir) if f.endswith('.yaml')])
-
-    for filename in yaml_files:
+    for filename, file_path in _list_character_files(characters_dir):
         try:
-            character = load_character(filename, characters_dir)
+            # Single stat per file; the directory scan already proved existence
+            character = _load_character_file(file_path, os.stat(file_path).st_mtime_ns)
             characters.append(character)
         except Exception as e:
             print(f"⚠️  Warning: Could not load {filename}: {e}")
@@ -72,26 +123,46 @@ def load_all_characters(characters_dir: str = "data/characters") -> List[Dict]:
     return characters
 
 
-def create_party(
-    character_files: List[str] = None,
-    characters_dir: str = "data/characters",
-    providers: List[str] = None
-) -> List:
+def _list_character_files(characters_dir: str) -> List[tuple]:
     """
-    Create a party of player agents from character files.
+    List YAML files in a directory with a single scandir pass.
 
     Args:
-        character_files: List of character filenames (default: all YAML files in directory)
-        characters_dir: Directory containing character files
-        providers: List of providers for each player (default: ["groq", "gemini", "groq"])
+        characters_dir: Directory containing character YAML files
 
     Returns:
-        List of Player Agent instances
+        Sorted list of (filename, path) tuples
+    """
+    key = (os.path.abspath(characters_dir), os.stat(characters_dir).st_mtime_ns)
+    cached = _DIR_CACHE.get(key)
+    if cached is not None:
+        return cached
 
-    Example:
-        >>> party = create_party()
-        >>> print([p.name for p in party])
-        ['Thorin Ironforge', 'Kira Shadowstep', 'Elara Moonshadow']
+    with os.scandir(characters_dir) as it:
+        entries = sorted(
+            (e.name, e.path) for e in it
+            if e.name.endswith('.yaml') and e.is_file()
+        )
+
+    _DIR_CACHE[key] = entries
+    return entries
+
+
+def _resolve_party_config(
+    character_files: List[str],
+    characters_dir: str,
+    providers: List[str]
+) -> tuple:
+    """
+    Load character sheets and match each one with a provider.
+
+    Args:
+        character_files: List of character filenames (None = all YAML files in directory)
+        characters_dir: Directory containing character files
+        providers: List of providers for each player (None = default rotation)
+
+    Returns:
+        Tuple of (characters, providers) with equal length
     """
     # Default to loading all characters
     if character_files is None:
@@ -109,18 +180,98 @@ def create_party(
         # Cycle through providers if not enough specified
         providers = (providers * ((len(characters) // len(providers)) + 1))[:len(characters)]
 
-    # Create player agents
+    return characters, providers
+
+
+async def _create_player_async(character: Dict, provider: str):
+    """
+    Create a player agent in a worker thread.
+
+    datapizza clients are synchronous, so construction is offloaded to a thread
+    to let several agents be built concurrently.
+    """
+    return await asyncio.to_thread(create_player_agent, character, provider=provider)
+
+
+async def create_party_async(
+    character_files: List[str] = None,
+    characters_dir: str = "data/characters",
+    providers: List[str] = None
+) -> List:
+    """
+    Create a party of player agents concurrently.
+
+    Same arguments and return value as create_party(), but all agents are
+    constructed in parallel so setup time is bounded by the slowest client.
+
+    Example:
+        >>> party = await create_party_async()
+        >>> print([p.name for p in party])
+    """
+    characters, providers = _resolve_party_config(character_files, characters_dir, providers)
+
+    # Create player agents concurrently
+    results = await asyncio.gather(
+        *[_create_player_async(c, p) for c, p in zip(characters, providers)],
+        return_exceptions=True
+    )
+
     party = []
-    for character, provider in zip(characters, providers):
-        try:
-            player = create_player_agent(character, provider=provider)
-            party.append(player)
-        except Exception as e:
-            print(f"❌ Error creating agent for {character.get('name', 'Unknown')}: {e}")
+    for character, result in zip(characters, results):
+        if isinstance(result, Exception):
+            print(f"❌ Error creating agent for {character.get('name', 'Unknown')}: {result}")
+            continue
+        party.append(result)
 
     return party
 
 
+def create_party(
+    character_files: List[str] = None,
+    characters_dir: str = "data/characters",
+    providers: List[str] = None
+) -> List:
+    """
+    Create a party of player agents from character files.
+
+    Args:
+        character_files: List of character filenames (default: all YAML files in directory)
+        characters_dir: Directory containing character files
+        providers: List of providers for each player (default: ["groq", "gemini", "groq"])
+
+    Returns:
+        List of Player Agent instances
+
+    Example:
+        >>> party = create_party()
+        >>> print([p.name for p in party])
+        ['Thorin Ironforge', 'Kira Shadowstep', 'Elara Moonshadow']
+
+    Note:
+        Synchronous wrapper around create_party_async(). Must not be called
+        from inside a running event loop - await create_party_async() instead.
+    """
+    return asyncio.run(create_party_async(character_files, characters_dir, providers))
+
+
+async def create_game_agents_async(
+    dm_model: str = "gpt-4o-mini",
+    player_providers: List[str] = None
+) -> tuple:
+    """
+    Create all agents for a game session (DM + Party) concurrently.
+
+    Same arguments and return value as create_game_agents().
+    """
+    # DM and party are independent - build them at the same time
+    dm, party = await asyncio.gather(
+        asyncio.to_thread(create_dm_agent, model=dm_model),
+        create_party_async(providers=player_providers)
+    )
+
+    return dm, party
+
+
 def create_game_agents(
     dm_model: str = "gpt-4o-mini",
     player_providers: List[str] = None
@@ -139,14 +290,11 @@ def create_game_agents(
         >>> dm, players = create_game_agents()
         >>> print(f"DM: {dm.name}")
         >>> print(f"Players: {[p.name for p in players]}")
-    """
-    # Create DM with OpenAI
-    dm = create_dm_agent(model=dm_model)
-
-    # Create party with mixed providers
-    party = create_party(providers=player_providers)
 
-    return dm, party
+    Note:
+        Synchronous wrapper around create_game_agents_async().
+    """
+    return asyncio.run(create_game_agents_async(dm_model, player_providers))
 
 
 # Convenience exports
@@ -154,7 +302,9 @@ __all__ = [
     'load_character',
     'load_all_characters',
     'create_party',
+    'create_party_async',
     'create_game_agents',
+    'create_game_agents_async',
     'create_dm_agent',
     'create_player_agent',
 ]
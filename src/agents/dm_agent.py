@@ -5,14 +5,15 @@ Complete DM agent with:
 - RAG integration (rules, monsters, adventure)
 - Dice rolling tool
 - Narrative-focused system prompt
-- OpenAI client for high-quality narration
+- OpenAI client for high-quality narration (with prompt-prefix caching)
 """
 
 from datapizza.agents import Agent
 from datapizza.clients.openai import OpenAIClient
 
 from src.config import OPENAI_API_KEY
-from src.rag.retrieval import query_rules_tool, query_monsters_tool, query_adventure_tool
+from src.http_pool import share_connection_pool
+from src.rag.retrieval import query_rules_tool, query_monsters_tool, query_adventure_tool, query_knowledge_tool
 from src.tools.dice import roll_dice
 
 
@@ -32,6 +33,7 @@ You have access to:
 - D&D 5e rules knowledge (use query_rules_tool)
 - Monster stats (use query_monsters_tool)
 - Adventure narrative (use query_adventure_tool)
+- Several of the above in one call (use query_knowledge_tool when a turn needs more than one lookup)
 - Dice rolling (use roll_dice tool)
 
 Style guidelines:
@@ -52,10 +54,45 @@ Game flow:
 Remember: You are facilitating a fun, collaborative story. Be fair, creative, and responsive to player actions.
 """.strip()
 
+# Every DM request starts with the same system prompt and tool schemas;
+# a fixed cache key routes them to the same OpenAI prompt cache
+DM_PROMPT_CACHE_KEY = "dnd-dm"
+
+
+class PromptCachedOpenAIClient(OpenAIClient):
+    """
+    OpenAIClient that tags every request with a prompt_cache_key.
+
+    OpenAI caches long prompt prefixes automatically; requests with the same
+    key are routed to the same cache, so the static prefix is billed at the
+    cached rate and skips prefill.
+    """
+
+    def __init__(self, *args, prompt_cache_key: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prompt_cache_key = prompt_cache_key
+
+    def _invoke(self, **kwargs):
+        kwargs.setdefault("prompt_cache_key", self.prompt_cache_key)
+        return super()._invoke(**kwargs)
+
+    async def _a_invoke(self, **kwargs):
+        kwargs.setdefault("prompt_cache_key", self.prompt_cache_key)
+        return await super()._a_invoke(**kwargs)
+
+    def _stream_invoke(self, *args, **kwargs):
+        kwargs.setdefault("prompt_cache_key", self.prompt_cache_key)
+        return super()._stream_invoke(*args, **kwargs)
+
+    def _a_stream_invoke(self, *args, **kwargs):
+        kwargs.setdefault("prompt_cache_key", self.prompt_cache_key)
+        return super()._a_stream_invoke(*args, **kwargs)
+
 
 def create_dm_agent(
     model: str = "gpt-4o-mini",
-    temperature: float = 0.8
+    temperature: float = 0.8,
+    stream: bool = False
 ) -> Agent:
     """
     Create DM agent with OpenAI for high-quality narration.
@@ -63,6 +100,7 @@ def create_dm_agent(
     Args:
         model: OpenAI model name (default: gpt-4o-mini for best cost/quality)
         temperature: Creativity level (0.8 recommended for DM)
+        stream: Stream text deltas from stream_invoke() (lets callers stop early)
 
     Returns:
         Configured DM Agent with OpenAI client
@@ -77,11 +115,13 @@ def create_dm_agent(
         GPT-4o-mini provides excellent balance of quality and cost.
     """
     # Create OpenAI client for DM (high quality narration)
-    client = OpenAIClient(
+    # Shares keep-alive connections with other agents on the same endpoint
+    client = share_connection_pool(PromptCachedOpenAIClient(
         api_key=OPENAI_API_KEY,
         model=model,
-        temperature=temperature
-    )
+        temperature=temperature,
+        prompt_cache_key=DM_PROMPT_CACHE_KEY
+    ))
 
     # Create DM agent with all tools
     dm_agent = Agent(
@@ -92,8 +132,10 @@ def create_dm_agent(
             roll_dice,
             query_rules_tool,
             query_monsters_tool,
-            query_adventure_tool
-        ]
+            query_adventure_tool,
+            query_knowledge_tool
+        ],
+        stream=stream
     )
 
     return dm_agent
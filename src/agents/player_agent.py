@@ -9,7 +9,8 @@ Complete player agent with:
 - Support for Groq and Gemini clients (fast, cost-effective)
 """
 
-from typing import Dict, Literal
+from functools import lru_cache
+from typing import Callable, Dict, Literal, Optional, Tuple
 
 from datapizza.agents import Agent
 from datapizza.clients.google import GoogleClient
@@ -17,10 +18,53 @@ from datapizza.clients.openai import OpenAIClient
 from datapizza.clients.openai_like import OpenAILikeClient
 
 from src.config import GROQ_API_KEY, GROQ_MODEL, GOOGLE_API_KEY, OPENAI_API_KEY
+from src.http_pool import share_connection_pool
 from src.rag.retrieval import query_rules_tool
 from src.tools.dice import roll_dice
 
 
+class _LazyClient:
+    """
+    Proxy that defers LLM client construction until first use.
+
+    Creating an agent only to inspect its name or tools then costs nothing;
+    API keys are still checked up front by create_player_agent.
+    """
+
+    def __init__(self, factory: Callable):
+        self._factory = factory
+        self._inner = None
+
+    def __getattr__(self, item):
+        # Only called for attributes not found on the proxy itself
+        inner = self.__dict__.get("_inner")
+        if inner is None:
+            inner = self.__dict__["_factory"]()
+            self._inner = inner
+        return getattr(inner, item)
+
+
+# Provider -> (API key, client factory taking temperature), resolved at import
+_CLIENT_FACTORIES: Dict[str, Tuple[Optional[str], Callable]] = {
+    "openai": (OPENAI_API_KEY, lambda temperature: share_connection_pool(OpenAIClient(
+        api_key=OPENAI_API_KEY,
+        model="gpt-4o-mini",  # Fast and cost-effective
+        temperature=temperature
+    ))),
+    "gemini": (GOOGLE_API_KEY, lambda temperature: GoogleClient(
+        api_key=GOOGLE_API_KEY,
+        model="gemini-2.5-pro",  # Updated model name
+        temperature=temperature
+    )),
+    "groq": (GROQ_API_KEY, lambda temperature: share_connection_pool(OpenAILikeClient(
+        api_key=GROQ_API_KEY,
+        base_url="https://api.groq.com/openai/v1",
+        model=GROQ_MODEL,
+        temperature=temperature
+    ))),
+}
+
+
 def create_player_system_prompt(character_sheet: Dict) -> str:
     """
     Create system prompt for player agent based on character sheet.
@@ -30,17 +74,25 @@ def create_player_system_prompt(character_sheet: Dict) -> str:
 
     Returns:
         Formatted system prompt
+
+    Note:
+        Prompts are memoized on the fields they use, so re-creating the same
+        character returns the already-built string.
     """
-    return f"""
-You are playing {character_sheet['name']}, a level {character_sheet.get('level', 1)} {character_sheet['race']} {character_sheet['class']}.
+    key = (
+        character_sheet['name'],
+        character_sheet.get('level', 1),
+        character_sheet['race'],
+        character_sheet['class'],
+        character_sheet.get('background', 'Adventurer'),
+        character_sheet.get('personality', 'Brave and curious'),
+        tuple(character_sheet.get('skills', ['Various'])),
+    )
+    return _build_player_system_prompt(key)
 
-CHARACTER DETAILS:
-Name: {character_sheet['name']}
-Class: {character_sheet['class']}
-Race: {character_sheet['race']}
-Background: {character_sheet.get('background', 'Adventurer')}
-Personality: {character_sheet.get('personality', 'Brave and curious')}
-Key Skills: {', '.join(character_sheet.get('skills', ['Various']))}
+
+# Fixed part of every player prompt, shared by all characters
+_PLAYER_PROMPT_TAIL = """
 
 GAMEPLAY INSTRUCTIONS:
 - Stay in character - act according to your personality and background
@@ -55,8 +107,24 @@ You have access to:
 - D&D 5e rules (use query_rules_tool for spell/ability lookups)
 - Dice rolling (DM will usually call for rolls, but you can suggest them)
 
-Remember: You are ONE character in a party of adventurers. Work together to overcome challenges and progress the story.
-""".strip()
+Remember: You are ONE character in a party of adventurers. Work together to overcome challenges and progress the story."""
+
+
+@lru_cache(maxsize=64)
+def _build_player_system_prompt(key: tuple) -> str:
+    """Format the character-specific prompt head and append the fixed tail"""
+    name, level, race, class_, background, personality, skills = key
+    head = (
+        f"You are playing {name}, a level {level} {race} {class_}.\n\n"
+        f"CHARACTER DETAILS:\n"
+        f"Name: {name}\n"
+        f"Class: {class_}\n"
+        f"Race: {race}\n"
+        f"Background: {background}\n"
+        f"Personality: {personality}\n"
+        f"Key Skills: {', '.join(skills)}"
+    )
+    return "".join((head, _PLAYER_PROMPT_TAIL))
 
 
 def create_player_agent(
@@ -75,6 +143,9 @@ def create_player_agent(
     Returns:
         Configured Player Agent
 
+    Raises:
+        ValueError: If the provider is unknown or its API key is not set
+
     Example:
         >>> character = load_character("character1.yaml")
         >>> player = create_player_agent(character, provider="openai")
@@ -84,28 +155,14 @@ def create_player_agent(
         Uses OpenAI (GPT-4o-mini), Groq (Llama 3.1) or Gemini for inference.
         OpenAI recommended for best tool calling support.
     """
-    # Create client based on provider
-    if provider == "openai":
-        client = OpenAIClient(
-            api_key=OPENAI_API_KEY,
-            model="gpt-4o-mini",  # Fast and cost-effective
-            temperature=temperature
-        )
-    elif provider == "gemini":
-        client = GoogleClient(
-            api_key=GOOGLE_API_KEY,
-            model="gemini-2.5-pro",  # Updated model name
-            temperature=temperature
-        )
-    elif provider == "groq":
-        client = OpenAILikeClient(
-            api_key=GROQ_API_KEY,
-            base_url="https://api.groq.com/openai/v1",
-            model=GROQ_MODEL,
-            temperature=temperature
-        )
-    else:
+    # Look up provider and fail fast on misconfiguration (client built lazily)
+    entry = _CLIENT_FACTORIES.get(provider)
+    if entry is None:
         raise ValueError(f"Invalid provider: {provider}. Must be 'groq', 'gemini', or 'openai'")
+    api_key, factory = entry
+    if not api_key:
+        raise ValueError(f"Missing API key for provider '{provider}'")
+    client = _LazyClient(lambda: factory(temperature))
 
     # Create system prompt
     system_prompt = create_player_system_prompt(character_sheet)
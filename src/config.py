@@ -17,7 +17,15 @@ EMBEDDING_MODEL = "text-embedding-3-small"
 # Vectorstore configuration
 QDRANT_LOCATION = ":memory:"  # Change to host/port for external Qdrant
 
+# On-disk store reused by the RAG tests while the documents are unchanged
+QDRANT_TEST_PATH = os.getenv("QDRANT_TEST_PATH", ".qdrant_test_cache")
+
 # Collections
 COLLECTION_RULES = "dnd_rules"
 COLLECTION_MONSTERS = "dnd_monsters"
 COLLECTION_ADVENTURE = "dnd_adventure"
+
+# Collections stored with int8 scalar quantization on a Qdrant server
+# (the monsters collection is small enough that fp32 search is cheaper).
+# Local ":memory:" mode always does exact search and ignores these settings.
+QUANTIZED_COLLECTIONS = (COLLECTION_RULES, COLLECTION_ADVENTURE)
@@ -0,0 +1,55 @@
+"""
+Game logging
+
+Provides:
+- get_logger() returning loggers under the "dnd" namespace
+
+Records are handed to a QueueHandler and written to stdout by a background
+QueueListener thread, so the game loop never blocks on terminal I/O.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+
+_ROOT_NAME = "dnd"
+_listener = None
+
+
+def _setup() -> logging.Logger:
+    """Attach the queue handler and start the listener (once)"""
+    global _listener
+
+    root = logging.getLogger(_ROOT_NAME)
+    if _listener is not None:
+        return root
+
+    log_queue = queue.SimpleQueue()
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter("%(message)s"))  # Same output as print()
+
+    _listener = logging.handlers.QueueListener(log_queue, stream)
+    _listener.start()
+    atexit.register(_listener.stop)  # Flush pending records on exit
+
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    root.propagate = False
+    return root
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a game logger.
+
+    Args:
+        name: Component name (e.g. "orchestrator")
+
+    Returns:
+        Logger named "dnd.<name>" writing through the shared queue
+    """
+    _setup()
+    return logging.getLogger(f"{_ROOT_NAME}.{name}")
@@ -0,0 +1,156 @@
+"""
+Shared HTTP connection pools for LLM clients
+
+Provides:
+- One pooled OpenAI SDK client per (API key, base URL), over HTTP/2
+- One pooled AsyncOpenAI SDK client per (API key, base URL) and event loop
+- share_connection_pool() to attach them to datapizza clients
+
+Every datapizza OpenAI-compatible client normally owns its own SDK client and
+therefore its own connection pool. Agents talking to the same endpoint (e.g.
+the DM, OpenAI players, the intent client and the embedders) now reuse warm
+keep-alive connections instead of each paying the TCP/TLS handshake, and
+concurrent requests are multiplexed over one HTTP/2 connection.
+
+Async connections belong to the event loop that opened them, and this code
+runs on several loops (asyncio.run in scripts and tests, datapizza's executor
+loop for async tools, the server loop), so async clients are created lazily
+inside each running loop and never shared between loops.
+"""
+
+import asyncio
+import atexit
+import weakref
+from typing import Dict, Optional, Tuple
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+
+# Connection pool sizing shared by all LLM clients
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+_PoolKey = Tuple[Optional[str], Optional[str]]
+
+# (api_key, base_url) -> OpenAI
+_SDK_CLIENTS: Dict[_PoolKey, OpenAI] = {}
+
+# event loop -> {(api_key, base_url) -> AsyncOpenAI}; entries go away with their loop
+_ASYNC_SDK_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[_PoolKey, AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pool_key(api_key: Optional[str], base_url: Optional[str]) -> _PoolKey:
+    return (api_key, str(base_url) if base_url is not None else None)
+
+
+def get_sdk_client(api_key: Optional[str], base_url: Optional[str] = None) -> OpenAI:
+    """
+    Get (or create) the pooled sync SDK client for an endpoint.
+
+    Args:
+        api_key: API key for the endpoint
+        base_url: Optional base URL (None = api.openai.com)
+
+    Returns:
+        OpenAI client shared by the whole process
+    """
+    key = _pool_key(api_key, base_url)
+    client = _SDK_CLIENTS.get(key)
+    if client is None:
+        client = OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=httpx.Client(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        )
+        _SDK_CLIENTS[key] = client
+    return client
+
+
+def get_async_sdk_client(api_key: Optional[str], base_url: Optional[str] = None) -> AsyncOpenAI:
+    """
+    Get (or create) the pooled async SDK client for an endpoint on the running loop.
+
+    Args:
+        api_key: API key for the endpoint
+        base_url: Optional base URL (None = api.openai.com)
+
+    Returns:
+        AsyncOpenAI client shared by everything on the current event loop
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    clients = _ASYNC_SDK_CLIENTS.setdefault(loop, {})
+    key = _pool_key(api_key, base_url)
+    client = clients.get(key)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=httpx.AsyncClient(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        )
+        clients[key] = client
+    return client
+
+
+def share_connection_pool(client):
+    """
+    Point an OpenAI-compatible datapizza client at the shared SDK clients.
+
+    Works for OpenAIClient, OpenAILikeClient and OpenAIEmbedder, which keep
+    their SDK clients in `client` / `a_client` and fetch the async one through
+    `_get_a_client()`. The sync client is set directly; the async one is
+    looked up per call on the running loop. Other clients are returned unchanged.
+
+    Args:
+        client: datapizza client instance
+
+    Returns:
+        The same client, for use inline in factories
+    """
+    if not (hasattr(client, "client") and hasattr(client, "a_client")):
+        return client
+
+    api_key = getattr(client, "api_key", None)
+    if not api_key:
+        return client  # Let the client raise its own missing-key error on first use
+
+    base_url = getattr(client, "base_url", None)
+    client.client = get_sdk_client(api_key, base_url)
+    client._get_a_client = lambda: get_async_sdk_client(api_key, base_url)
+    return client
+
+
+async def close_async_pools() -> None:
+    """Close the running loop's pooled async connections (call before the loop ends)"""
+    clients = _ASYNC_SDK_CLIENTS.pop(asyncio.get_running_loop(), {})
+    for async_client in clients.values():
+        try:
+            await async_client.close()
+        except Exception:
+            pass
+
+
+@atexit.register
+def _close_pools():
+    """Close pooled connections on interpreter exit"""
+    for sync_client in _SDK_CLIENTS.values():
+        try:
+            sync_client.close()
+        except Exception:
+            pass
+
+    # Async pools of loops that are still open (closed loops already dropped their transports)
+    for loop, clients in list(_ASYNC_SDK_CLIENTS.items()):
+        if loop.is_closed() or loop.is_running():
+            continue
+        for async_client in clients.values():
+            try:
+                loop.run_until_complete(async_client.close())
+            except Exception:
+                pass
+    _ASYNC_SDK_CLIENTS.clear()
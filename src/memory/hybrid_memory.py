@@ -10,16 +10,43 @@ Reference: docs/phases/PHASE_05_ORCHESTRATION.md
 Architecture: PROJECT.md Section 4.5
 """
 
+import copy
 import time
 import asyncio
-from typing import Dict, List
-from datapizza.memory import Memory
+import threading
+from typing import Any, Dict, List, Tuple
+from datapizza.memory import Memory, Turn
 from datapizza.type import ROLE, TextBlock
 from datapizza.agents import Agent
 
 from src.memory.message_board import MessageBoard, Message
 
 
+# Maximum board messages pushed into an agent's memory in one sync
+BOARD_CONTEXT_MESSAGES = 20
+
+# Board deltas with more text than this are formatted in a worker thread
+# so the event loop keeps serving other agents and WebSocket clients
+OFFLOAD_FORMAT_CHARS = 50_000
+
+
+def _format_board_context(messages: List[Message]) -> str:
+    """Format board messages as a context block for an agent's memory"""
+    return "Recent game context:\n" + "\n".join(f"[{m.speaker}]: {m.text}" for m in messages)
+
+
+def _add_turns(memory: Memory, turns: List[Tuple[Any, ROLE]]):
+    """
+    Append several (blocks, role) turns to a memory in one list extend.
+
+    Equivalent to calling memory.add_turn() for each pair in order.
+    """
+    memory.memory.extend(
+        Turn(blocks if isinstance(blocks, list) else [blocks], role)
+        for blocks, role in turns
+    )
+
+
 class HybridMemorySystem:
     """
     Individual agent memories + shared MessageBoard.
@@ -38,6 +65,12 @@ class HybridMemorySystem:
             name: Memory() for name in agent_names
         }
 
+        # Per-agent shallow copies bound to their own memory: (source, bound)
+        self._bound_agents: Dict[str, Tuple[Agent, Agent]] = {}
+
+        # Board sequence number each agent has already seen
+        self._board_seen: Dict[str, int] = {name: 0 for name in agent_names}
+
         # Shared components
         self.board = MessageBoard()
         self.context_snapshot = {
@@ -51,7 +84,8 @@ class HybridMemorySystem:
         agent: Agent,
         prompt: str,
         include_board_context: bool = True,
-        timeout: float = 60.0
+        timeout: float = 60.0,
+        post_to_board: bool = True
     ) -> any:
         """
         Agent generates response using:
@@ -59,12 +93,18 @@ class HybridMemorySystem:
         2. Recent board context (what others said)
         3. Context snapshot (game state)
 
+        Board messages the agent hasn't seen yet are appended to its memory
+        as a single user turn, so each call only sends the new events instead
+        of re-sending the whole context window inside the prompt.
+
         Args:
             agent_name: Name of the agent responding
             agent: Agent object
             prompt: User prompt for the agent
             include_board_context: Whether to include board context (default True)
             timeout: Maximum seconds to wait for agent response (default 60.0)
+            post_to_board: Post the response to the shared board (default True);
+                concurrent callers can pass False and post_response() in a fixed order
 
         Returns:
             Agent response object
@@ -72,44 +112,42 @@ class HybridMemorySystem:
         Raises:
             asyncio.TimeoutError: If agent doesn't respond within timeout
         """
-        # Build context from board
-        board_context = ""
-        if include_board_context and len(self.board.messages) > 0:
-            board_context = self.board.get_context_window(max_messages=20)
-            board_context = f"Recent game context:\n{board_context}\n\n"
-
-        # Full prompt with context
-        full_prompt = f"{board_context}{prompt}"
-
-        # Set agent's memory to the correct one for this agent
-        # Store original memory to restore later if agent is shared
-        original_memory = agent._memory
-        agent._memory = self.agent_memories[agent_name]
-
-        try:
-            # Agent uses own memory (now set in agent._memory)
-            # Add timeout to prevent infinite hangs
-            response = await asyncio.wait_for(
-                agent.a_run(full_prompt),
-                timeout=timeout
-            )
-
-            # Update agent's memory (it's already been updated by agent.a_run if stateless=False)
-            # But we keep it updated here for consistency with stateless agents
-            if agent._stateless:
-                self.agent_memories[agent_name].add_turn(
-                    TextBlock(content=full_prompt),
-                    role=ROLE.USER
-                )
-                self.agent_memories[agent_name].add_turn(
-                    response.content,
-                    role=ROLE.ASSISTANT
-                )
-        finally:
-            # Restore original memory if needed
-            agent._memory = original_memory
+        # Push new board events into the agent's own memory
+        if include_board_context:
+            await self._sync_board_context(agent_name)
+
+        # Copy of the agent permanently bound to this agent's memory
+        # (no swapping of shared state, so concurrent calls are safe)
+        bound_agent = self._bind_agent(agent_name, agent)
+
+        # Add timeout to prevent infinite hangs
+        response = await asyncio.wait_for(
+            bound_agent.a_run(prompt),
+            timeout=timeout
+        )
+
+        # Update agent's memory (it's already been updated by agent.a_run if stateless=False)
+        # But we keep it updated here for consistency with stateless agents
+        if bound_agent._stateless:
+            _add_turns(self.agent_memories[agent_name], [
+                (TextBlock(content=prompt), ROLE.USER),
+                (response.content, ROLE.ASSISTANT),
+            ])
 
         # Post to shared board
+        if post_to_board:
+            await self.post_response(agent_name, response)
+
+        return response
+
+    async def post_response(self, agent_name: str, response) -> None:
+        """
+        Post an agent response to the shared board.
+
+        Args:
+            agent_name: Name of the agent that responded
+            response: Agent response object
+        """
         message = Message(
             speaker=agent_name,
             text=response.text,
@@ -118,7 +156,53 @@ class HybridMemorySystem:
         )
         await self.board.post(message)
 
-        return response
+    async def _sync_board_context(self, agent_name: str):
+        """
+        Append board messages posted since the agent's last turn to its memory.
+
+        The agent's own messages are skipped - they are already in its memory
+        as assistant turns. Large deltas are formatted off the event loop.
+        """
+        new_messages, seq = self.board.get_since(
+            self._board_seen.get(agent_name, 0),
+            max_messages=BOARD_CONTEXT_MESSAGES
+        )
+        self._board_seen[agent_name] = seq
+
+        others = [m for m in new_messages if m.speaker != agent_name]
+        if not others:
+            return
+
+        if sum(len(m.text) for m in others) > OFFLOAD_FORMAT_CHARS:
+            context = await asyncio.to_thread(_format_board_context, others)
+        else:
+            context = _format_board_context(others)
+
+        self.agent_memories[agent_name].add_turn(
+            TextBlock(content=context),
+            role=ROLE.USER
+        )
+
+    def _bind_agent(self, agent_name: str, agent: Agent) -> Agent:
+        """
+        Get a shallow copy of agent that uses agent_name's memory.
+
+        Copies are created once per (name, agent) and share the client and
+        tools with the original; only memory and run locks are separate.
+        """
+        entry = self._bound_agents.get(agent_name)
+        if entry is not None and entry[0] is agent:
+            return entry[1]
+
+        bound = copy.copy(agent)
+        bound._memory = self.agent_memories[agent_name]
+        if hasattr(agent, "_lock"):
+            bound._lock = threading.Lock()
+        if hasattr(agent, "_async_lock"):
+            bound._async_lock = asyncio.Lock()
+
+        self._bound_agents[agent_name] = (agent, bound)
+        return bound
 
     def update_context_snapshot(self, game_state: dict):
         """
@@ -143,6 +227,7 @@ class HybridMemorySystem:
         for memory in self.agent_memories.values():
             memory.clear()
         self.board.clear()
+        self._board_seen = {name: 0 for name in self._board_seen}
         self.context_snapshot = {
             "game_state": {},
             "last_sync": time.time()
@@ -2,7 +2,7 @@
 MessageBoard - Shared event log for all game messages
 
 Provides:
-- Thread-safe message posting and retrieval
+- Message posting and retrieval (single event loop)
 - Subscriber pattern for WebSocket integration
 - Context window generation for LLM prompts
 
@@ -10,18 +10,35 @@ Reference: docs/phases/PHASE_05_ORCHESTRATION.md
 """
 
 import asyncio
+import itertools
+import json
+import sys
 import time
+import warnings
+from collections import Counter, deque
 from dataclasses import dataclass, field
-from typing import List, Callable, Dict, Optional
+from typing import Deque, List, Callable, Dict, Optional, Tuple, Union
 
+from src.game_log import get_logger
 
-@dataclass
+log = get_logger("message_board")
+
+
+# Maximum messages kept on the board (oldest are dropped first)
+MAX_BOARD_HISTORY = 2048
+
+# __slots__ dataclasses need Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Message:
     """Single message in the game log"""
     speaker: str          # "DM", "Player 1", "System"
     text: str            # Message content
     timestamp: float = field(default_factory=time.time)
-    metadata: Dict = field(default_factory=dict)  # type, dice_roll, turn_number, etc.
+    metadata: Optional[Dict] = None  # type, dice_roll, turn_number, etc. (None = no metadata)
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
         """Serialize for UI/storage"""
@@ -29,56 +46,154 @@ class Message:
             "speaker": self.speaker,
             "text": self.text,
             "timestamp": self.timestamp,
-            "metadata": self.metadata
+            "metadata": self.metadata or {}
         }
 
+    def to_json(self) -> str:
+        """
+        Serialize to a JSON string, encoded once and reused afterwards.
+
+        Messages are treated as immutable once posted, so the cached string
+        stays valid for every subscriber that sends it.
+        """
+        if self._json is None:
+            self._json = json.dumps(self.to_dict())
+        return self._json
+
 
 class MessageBoard:
     """
-    Thread-safe event log for all game messages.
+    Event log for all game messages.
     Used for UI display, tracing, and context building.
+
+    Messages live in a bounded ring buffer: appends are O(1) and memory stays
+    flat on long sessions. Pass max_history=None to keep the full history.
+
+    Not thread-safe: the board assumes it is only used from one asyncio event
+    loop. The append path in post() has no await, so it cannot interleave with
+    another post and needs no lock.
     """
 
-    def __init__(self):
-        self.messages: List[Message] = []
-        self.lock = asyncio.Lock()
-        self.subscribers: List[Callable] = []
+    def __init__(self, max_history: Optional[int] = MAX_BOARD_HISTORY):
+        self.messages: Deque[Message] = deque(maxlen=max_history)
+        # Column views of speaker/text kept in step with messages for context rendering
+        self._speakers: Deque[str] = deque(maxlen=max_history)
+        self._texts: Deque[str] = deque(maxlen=max_history)
+        # Subscriber callbacks keyed by the token returned from subscribe()
+        self.subscribers: Dict[int, Callable] = {}
+        self._next_token = itertools.count()
+        # Formatted context windows by size, valid until the next post/clear
+        self._ctx_cache: Dict[int, str] = {}
+        # Total messages ever posted (keeps counting after old ones are evicted)
+        self._post_count = 0
 
     async def post(self, message: Message):
         """Post message to board and notify subscribers"""
-        async with self.lock:
-            self.messages.append(message)
-            await self._notify_subscribers(message)
-
-    async def _notify_subscribers(self, message: Message):
-        """Notify all subscribers (e.g., WebSocket clients)"""
-        for callback in self.subscribers:
-            try:
-                await callback(message)
-            except Exception as e:
-                print(f"Error notifying subscriber: {e}")
+        # No await until notification - atomic within the event loop
+        self.messages.append(message)
+        self._speakers.append(message.speaker)
+        self._texts.append(message.text)
+        self._post_count += 1
+        self._ctx_cache.clear()
+        subscribers = list(self.subscribers.values())
+
+        await self._notify_subscribers(message, subscribers)
+
+    async def _notify_subscribers(self, message: Message, subscribers: List[Callable]):
+        """Notify all subscribers (e.g., WebSocket clients) concurrently"""
+        results = await asyncio.gather(
+            *[callback(message) for callback in subscribers],
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                log.warning(f"Error notifying subscriber: {result}")
+
+    def _tail(self, n: int) -> List[Message]:
+        """Last N messages in order, walking from the right end only (O(n))"""
+        tail = list(itertools.islice(reversed(self.messages), max(0, n)))
+        tail.reverse()
+        return tail
 
     def get_recent(self, n: int = 50) -> List[Message]:
         """Get last N messages for UI"""
-        return self.messages[-n:]
+        return self._tail(n)
 
     def get_context_window(self, max_messages: int = 20) -> str:
         """Get recent messages formatted for LLM context"""
-        recent = self.messages[-max_messages:]
-        return "\n".join([f"[{m.speaker}]: {m.text}" for m in recent])
-
-    def subscribe(self, callback: Callable):
-        """Subscribe to new messages (for WebSocket)"""
-        self.subscribers.append(callback)
-
-    def unsubscribe(self, callback: Callable):
-        """Unsubscribe from new messages"""
-        if callback in self.subscribers:
-            self.subscribers.remove(callback)
+        cached = self._ctx_cache.get(max_messages)
+        if cached is not None:
+            return cached
+
+        # Walk the speaker/text columns from the newest end, then restore order
+        n = max(0, max_messages)
+        pairs = zip(
+            itertools.islice(reversed(self._speakers), n),
+            itertools.islice(reversed(self._texts), n)
+        )
+        lines = [f"[{s}]: {t}" for s, t in pairs]
+        lines.reverse()
+        context = "\n".join(lines)
+        self._ctx_cache[max_messages] = context
+        return context
+
+    def speaker_counts(self) -> Counter:
+        """Count messages per speaker (scans the speaker column, not Message objects)"""
+        return Counter(self._speakers)
+
+    def get_since(self, seq: int, max_messages: Optional[int] = None) -> Tuple[List[Message], int]:
+        """
+        Get messages posted after a sequence number.
+
+        Args:
+            seq: Sequence number returned by a previous call (0 = from the start)
+            max_messages: Optional cap on returned messages (newest are kept)
+
+        Returns:
+            Tuple of (new messages, current sequence number)
+        """
+        if seq > self._post_count:
+            # Board was cleared since the caller last looked
+            seq = 0
+        count = min(self._post_count - seq, len(self.messages))
+        if max_messages is not None:
+            count = min(count, max_messages)
+        return self._tail(count), self._post_count
+
+    def subscribe(self, callback: Callable) -> int:
+        """
+        Subscribe to new messages (for WebSocket).
+
+        Returns:
+            Token to pass to unsubscribe()
+        """
+        token = next(self._next_token)
+        self.subscribers[token] = callback
+        return token
+
+    def unsubscribe(self, token: Union[int, Callable]):
+        """Unsubscribe from new messages using the token from subscribe()"""
+        if callable(token):
+            warnings.warn(
+                "Unsubscribing by callback is deprecated; pass the token returned by subscribe()",
+                DeprecationWarning,
+                stacklevel=2
+            )
+            for key, callback in list(self.subscribers.items()):
+                if callback == token:
+                    del self.subscribers[key]
+                    return
+            return
+
+        self.subscribers.pop(token, None)
 
     def clear(self):
         """Clear all messages (useful for testing)"""
         self.messages.clear()
+        self._speakers.clear()
+        self._texts.clear()
+        self._post_count = 0
+        self._ctx_cache.clear()
 
     def __len__(self) -> int:
         """Return number of messages"""
@@ -4,21 +4,32 @@ Intent Parsing & Generation System
 Provides:
 - IntentType enum (DIRECTED, OPEN, INITIATIVE)
 - DMIntent parsing from DM messages
-- PlayerIntent generation with relevance scoring
+- PlayerIntent generation with relevance scoring (single or batched)
 - Smart ordering algorithm for player responses
 
 Reference: docs/phases/PHASE_05_ORCHESTRATION.md
 """
 
+import asyncio
+import hashlib
+import heapq
 import re
 import random
 import os
+from collections import OrderedDict
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field
 from datapizza.agents import Agent
 from datapizza.clients.openai import OpenAIClient
 
+from src.game_log import get_logger
+from src.http_pool import share_connection_pool
+
+log = get_logger("intents")
+
 # Create dedicated intent client (fast model for structured outputs)
 _intent_client = None
 
@@ -26,11 +37,11 @@ def get_intent_client():
     """Get or create OpenAI client for intent generation"""
     global _intent_client
     if _intent_client is None:
-        _intent_client = OpenAIClient(
+        _intent_client = share_connection_pool(OpenAIClient(
             api_key=os.getenv("OPENAI_API_KEY"),
             model="gpt-4o-mini",  # Fast and supports structured outputs
             temperature=0.3
-        )
+        ))
     return _intent_client
 
 
@@ -61,6 +72,38 @@ class DMIntent:
             return f"DMIntent({self.type.value.upper()})"
 
 
+# Initiative/combat keywords (matched anywhere, like substring checks)
+_INITIATIVE_KEYWORDS = (
+    "initiative",
+    "roll for initiative",
+    "combat begins",
+    "attacks",
+    "roll initiative"
+)
+
+# Dialogue context clues (matched anywhere)
+_DIALOGUE_KEYWORDS = ("says", "asks you", "speaks to")
+
+
+@lru_cache(maxsize=32)
+def _intent_pattern(player_names: Tuple[str, ...]) -> re.Pattern:
+    """
+    Compile one regex classifying every intent signal in a single pass.
+
+    Named groups: "init" (initiative keywords), "name" (whole-word player
+    name, lowercased) and "dlg" (dialogue clues).
+    """
+    alternatives = [
+        "(?P<init>" + "|".join(map(re.escape, _INITIATIVE_KEYWORDS)) + ")"
+    ]
+    if player_names:
+        # Longest first so a name is never shadowed by its own prefix
+        names = sorted({name.lower() for name in player_names}, key=len, reverse=True)
+        alternatives.append(r"(?P<name>\b(?:" + "|".join(map(re.escape, names)) + r")\b)")
+    alternatives.append("(?P<dlg>" + "|".join(map(re.escape, _DIALOGUE_KEYWORDS)) + ")")
+    return re.compile("|".join(alternatives))
+
+
 def parse_dm_intent(dm_message: str, player_names: List[str]) -> DMIntent:
     """
     Parse DM message to determine intent type.
@@ -77,33 +120,27 @@ def parse_dm_intent(dm_message: str, player_names: List[str]) -> DMIntent:
     Returns:
         DMIntent with type and optional target
     """
-    text_lower = dm_message.lower()
-
-    # Check for initiative/combat
-    initiative_keywords = [
-        "initiative",
-        "roll for initiative",
-        "combat begins",
-        "attacks",
-        "roll initiative"
-    ]
-    if any(keyword in text_lower for keyword in initiative_keywords):
-        return DMIntent(IntentType.INITIATIVE, context="combat")
-
-    # Check for directed prompt (player name mentioned)
-    for name in player_names:
-        # Match whole word (avoid false positives)
-        pattern = rf'\b{re.escape(name.lower())}\b'
-        if re.search(pattern, text_lower):
-            return DMIntent(IntentType.DIRECTED, target=name, context="exploration")
+    # Single scan collecting all signals; priority is applied afterwards
+    mentioned = set()
+    dialogue = False
+    for match in _intent_pattern(tuple(player_names)).finditer(dm_message.lower()):
+        kind = match.lastgroup
+        if kind == "init":
+            # Initiative/combat wins over everything else
+            return DMIntent(IntentType.INITIATIVE, context="combat")
+        elif kind == "name":
+            mentioned.add(match.group("name"))
+        else:
+            dialogue = True
 
-    # Check context clues
-    context = "exploration"
-    if any(word in text_lower for word in ["says", "asks you", "speaks to"]):
-        context = "dialogue"
+    # Check for directed prompt (first player in party order wins)
+    if mentioned:
+        for name in player_names:
+            if name.lower() in mentioned:
+                return DMIntent(IntentType.DIRECTED, target=name, context="exploration")
 
     # Default: open prompt
-    return DMIntent(IntentType.OPEN, context=context)
+    return DMIntent(IntentType.OPEN, context="dialogue" if dialogue else "exploration")
 
 
 class PlayerIntent(BaseModel):
@@ -114,20 +151,58 @@ class PlayerIntent(BaseModel):
     reason: str
 
 
+# Time budget (seconds) for one intent request; slower calls fall back to defaults
+INTENT_TIMEOUT = 5.0
+
+# LRU cache of generated intents: (player, dm message digest, context digest) -> intent
+INTENT_CACHE_SIZE = 256
+_intent_cache: "OrderedDict[Tuple[str, bytes, bytes], PlayerIntent]" = OrderedDict()
+
+
+def _intent_key(player_name: str, dm_message: str, game_context: str) -> Tuple[str, bytes, bytes]:
+    """Cache key for an intent query (long texts are hashed)"""
+    return (
+        player_name,
+        hashlib.blake2b(dm_message.encode("utf-8"), digest_size=16).digest(),
+        hashlib.blake2b(game_context.encode("utf-8"), digest_size=16).digest(),
+    )
+
+
+def _get_cached_intent(key: Tuple[str, bytes, bytes]) -> Optional[PlayerIntent]:
+    """Return a copy of a cached intent, or None on miss"""
+    intent = _intent_cache.get(key)
+    if intent is None:
+        return None
+    _intent_cache.move_to_end(key)
+    return intent.model_copy()
+
+
+def _cache_intent(key: Tuple[str, bytes, bytes], intent: PlayerIntent) -> None:
+    """Store a model-generated intent (never error defaults)"""
+    _intent_cache[key] = intent.model_copy()
+    _intent_cache.move_to_end(key)
+    if len(_intent_cache) > INTENT_CACHE_SIZE:
+        _intent_cache.popitem(last=False)
+
+
 async def generate_player_intent(
     player_agent: Agent,
     dm_message: str,
-    game_context: str
+    game_context: str,
+    intent_client: Optional[OpenAIClient] = None
 ) -> PlayerIntent:
     """
     Generate intent for a player agent.
 
     Uses dedicated OpenAI client for structured outputs (Groq doesn't support json_schema).
+    Identical queries (same player, DM message and context) are answered
+    from an LRU cache.
 
     Args:
         player_agent: Player agent to query
         dm_message: DM's latest message
         game_context: Recent game context (from MessageBoard)
+        intent_client: Client for structured outputs (default: shared intent client)
 
     Returns:
         PlayerIntent with relevance score and reasoning
@@ -135,6 +210,11 @@ async def generate_player_intent(
     # Get character info from agent's system prompt
     character_name = player_agent.name
 
+    key = _intent_key(character_name, dm_message, game_context)
+    cached = _get_cached_intent(key)
+    if cached is not None:
+        return cached
+
     intent_prompt = f"""
 You are analyzing whether {character_name} should respond to this D&D game situation.
 
@@ -148,19 +228,20 @@ Provide a brief reason (one sentence).
 
     try:
         # Use dedicated OpenAI client (supports structured outputs)
-        client = get_intent_client()
-        response = await client.a_structured_response(
-            input=intent_prompt,
-            output_cls=PlayerIntent
+        client = intent_client or get_intent_client()
+        response = await asyncio.wait_for(
+            client.a_structured_response(input=intent_prompt, output_cls=PlayerIntent),
+            timeout=INTENT_TIMEOUT
         )
 
         intent = response.structured_data[0]
         intent.player_name = character_name
+        _cache_intent(key, intent)
         return intent
 
     except Exception as e:
         # Fallback: default intent
-        print(f"Error generating intent for {character_name}: {e}")
+        log.warning(f"Error generating intent for {character_name}: {e or type(e).__name__}")
         return PlayerIntent(
             player_name=character_name,
             wants_to_respond=True,
@@ -169,9 +250,116 @@ Provide a brief reason (one sentence).
         )
 
 
+class PlayerIntentBatch(BaseModel):
+    """Intents for several players returned by one structured call"""
+    intents: List[PlayerIntent]
+
+
+async def generate_player_intents_batch(
+    player_agents: List[Agent],
+    dm_message: str,
+    game_context: str,
+    intent_client: Optional[OpenAIClient] = None
+) -> List[PlayerIntent]:
+    """
+    Generate intents for all players with a single structured-output request.
+
+    The DM message and game context are sent once instead of once per player,
+    and players whose identical query is cached are left out of the request.
+    Falls back to per-player generate_player_intent() calls if the batch
+    request fails, and to default intents if it exceeds INTENT_TIMEOUT.
+
+    Args:
+        player_agents: Player agents to evaluate
+        dm_message: DM's latest message
+        game_context: Recent game context (from MessageBoard)
+        intent_client: Client for structured outputs (default: shared intent client)
+
+    Returns:
+        One PlayerIntent per player, in the same order as player_agents
+    """
+    keys = {player.name: _intent_key(player.name, dm_message, game_context) for player in player_agents}
+
+    # Serve repeated queries from the cache, ask the model only for the rest
+    by_name = {}
+    for name, key in keys.items():
+        cached = _get_cached_intent(key)
+        if cached is not None:
+            by_name[name] = cached
+    missing = [player for player in player_agents if player.name not in by_name]
+
+    if missing:
+        by_name.update(await _request_intents_batch(missing, dm_message, game_context, keys, intent_client))
+
+    intents = []
+    for player in player_agents:
+        intent = by_name.get(player.name)
+        if intent is None:
+            # Player missing from the batch (or batch timed out): same default as the error fallback
+            intent = PlayerIntent(
+                player_name=player.name,
+                wants_to_respond=True,
+                relevance_score=5,
+                reason="Default response (missing from batch)"
+            )
+        intents.append(intent)
+    return intents
+
+
+async def _request_intents_batch(
+    player_agents: List[Agent],
+    dm_message: str,
+    game_context: str,
+    keys: Dict[str, Tuple[str, bytes, bytes]],
+    intent_client: Optional[OpenAIClient] = None
+) -> Dict[str, PlayerIntent]:
+    """Run the batched intent request for the given players (name -> intent)"""
+    names = [player.name for player in player_agents]
+
+    intent_prompt = f"""
+You are analyzing whether each of these D&D characters should respond to this game situation: {', '.join(names)}.
+
+DM Message: {dm_message}
+Recent Game Context: {game_context}
+
+For EACH character, return one intent with:
+- player_name: the character's name exactly as listed
+- wants_to_respond: whether the character wants to respond to this situation
+- relevance_score (0-10): How appropriate is it for the character to act now?
+- reason: a brief reason (one sentence)
+"""
+
+    try:
+        client = intent_client or get_intent_client()
+        response = await asyncio.wait_for(
+            client.a_structured_response(input=intent_prompt, output_cls=PlayerIntentBatch),
+            timeout=INTENT_TIMEOUT
+        )
+        batch_intents = response.structured_data[0].intents  # Empty/malformed result raises here
+    except asyncio.TimeoutError:
+        # Don't spend more time on this turn: callers fill in default intents
+        log.warning(f"Batched intents timed out after {INTENT_TIMEOUT}s, using defaults")
+        return {}
+    except Exception as e:
+        log.warning(f"Error generating batched intents, falling back to per-player: {e}")
+        results = await asyncio.gather(*[
+            generate_player_intent(player, dm_message, game_context, intent_client)
+            for player in player_agents
+        ])
+        return dict(zip(names, results))
+
+    by_name = {}
+    for intent in batch_intents:
+        if intent.player_name in names and intent.player_name not in by_name:
+            by_name[intent.player_name] = intent
+            _cache_intent(keys[intent.player_name], intent)
+    return by_name
+
+
 def smart_order_players(
     player_intents: List[PlayerIntent],
-    last_speakers: List[str]
+    last_speakers: List[str],
+    top_k: Optional[int] = None
 ) -> List[str]:
     """
     Order players by relevance, recency, and variety.
@@ -184,6 +372,7 @@ def smart_order_players(
     Args:
         player_intents: List of player intents
         last_speakers: Recent speaker history (most recent last)
+        top_k: Keep only the K highest-priority players (None = all)
 
     Returns:
         Ordered list of player names
@@ -195,28 +384,36 @@ def smart_order_players(
         # Fallback: no one wants to respond
         return []
 
+    # Recency inputs are the same for every player: compute them once
+    recent = set(last_speakers[-3:]) if last_speakers else set()
+    last = last_speakers[-1] if last_speakers else None
+
     scored_players = []
     for intent in active_intents:
+        name = intent.player_name
+
         # Relevance score (0-10, normalize to 0-1)
         relevance = intent.relevance_score / 10.0
 
         # Recency bonus (penalty for recent speakers)
-        recency = 1.0
-        if last_speakers:
-            if intent.player_name in last_speakers[-3:]:
-                recency = 0.5  # Spoke in last 3 turns
-            if intent.player_name == last_speakers[-1]:
-                recency = 0.0  # Spoke last turn
+        if name == last:
+            recency = 0.0  # Spoke last turn
+        elif name in recent:
+            recency = 0.5  # Spoke in last 3 turns
+        else:
+            recency = 1.0
 
         # Variety bonus (random factor 0-0.3)
         variety = random.random() * 0.3
 
         # Composite priority score
-        priority = (relevance * 0.5) + (recency * 0.3) + (variety * 0.2)
+        scored_players.append(((relevance * 0.5) + (recency * 0.3) + (variety * 0.2), name))
 
-        scored_players.append((intent.player_name, priority, intent.reason))
+    if top_k is not None and top_k < len(scored_players):
+        # Partial selection: O(N log K), same order as sort-then-slice
+        return [name for _, name in heapq.nlargest(max(0, top_k), scored_players, key=itemgetter(0))]
 
-    # Sort by priority (descending)
-    scored_players.sort(key=lambda x: x[1], reverse=True)
+    # Sort by priority (descending, stable on ties)
+    scored_players.sort(key=itemgetter(0), reverse=True)
 
-    return [name for name, _, _ in scored_players]
+    return [name for _, name in scored_players]
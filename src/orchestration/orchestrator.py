@@ -13,20 +13,30 @@ Architecture: PROJECT.md Section 4.5
 """
 
 import asyncio
+from collections import deque
 from typing import List, Optional
 from datapizza.agents import Agent
+from datapizza.clients.openai import OpenAIClient
 
+from src.game_log import get_logger
 from src.memory.hybrid_memory import HybridMemorySystem
 from src.memory.message_board import Message
 from src.orchestration.intents import (
     IntentType,
     DMIntent,
     parse_dm_intent,
-    generate_player_intent,
+    generate_player_intents_batch,
+    get_intent_client,
     smart_order_players
 )
 
 
+log = get_logger("orchestrator")
+
+# Speaker history kept for recency scoring (smart_order_players looks at the last 3)
+RECENT_SPEAKERS = 3
+
+
 class GameOrchestrator:
     """
     Main game orchestrator coordinating all agents.
@@ -43,7 +53,10 @@ class GameOrchestrator:
         self,
         dm_agent: Agent,
         player_agents: List[Agent],
-        memory_system: HybridMemorySystem
+        memory_system: HybridMemorySystem,
+        intent_client: Optional[OpenAIClient] = None,
+        parallel_players: bool = True,
+        speak_top_k: Optional[int] = None
     ):
         """
         Initialize game orchestrator.
@@ -52,16 +65,31 @@ class GameOrchestrator:
             dm_agent: Dungeon Master agent
             player_agents: List of player agents
             memory_system: HybridMemorySystem instance
+            intent_client: Client for intent generation (default: shared intent client)
+            parallel_players: Run player responses concurrently (default True);
+                False runs them one by one, so each player sees the previous replies
+            speak_top_k: On open prompts, let at most this many players respond
+                (highest priority first; None = everyone who wants to)
         """
         self.dm = dm_agent
         self.players = player_agents
         self.player_names = [p.name for p in player_agents]
+        self._players_by_name = {p.name: p for p in reversed(player_agents)}  # First wins on duplicates
         self.memory = memory_system
-        self.last_speakers = []
+        self.parallel_players = parallel_players
+        self.speak_top_k = speak_top_k
+        self.last_speakers = deque(maxlen=RECENT_SPEAKERS)  # Only recent speakers affect ordering
         self.game_active = False
         self.initiative_order = None
         self.turn_count = 0
 
+        # Build the intent client once, outside the per-turn intent calls
+        try:
+            self.intent_client = intent_client or get_intent_client()
+        except Exception as e:
+            log.warning(f"⚠️ Intent client unavailable, using default intents: {e}")
+            self.intent_client = None
+
     async def game_loop(self, max_turns: int = 50, initial_prompt: Optional[str] = None):
         """
         Main game loop - orchestrates multi-agent interaction.
@@ -70,7 +98,7 @@ class GameOrchestrator:
         1. DM narrates/prompts
         2. Parse DM intent
         3. Determine who responds (directed/open/initiative)
-        4. Players respond in calculated order
+        4. Players respond (concurrently, recorded in calculated order)
         5. Repeat
 
         Args:
@@ -104,38 +132,38 @@ class GameOrchestrator:
 
             # 2. Parse DM intent
             intent = parse_dm_intent(dm_response.text, self.player_names)
-            print(f"[Turn {self.turn_count}] {intent}")
+            log.info(f"[Turn {self.turn_count}] {intent}")
 
             # 3. Determine who responds
             responders = await self._determine_responders(intent, dm_response.text)
 
             # 4. Players respond
-            for player in responders:
-                try:
-                    player_response = await self.memory.agent_respond(
-                        player.name,
-                        player,
-                        f"Respond to DM's message: {dm_response.text}",
-                        timeout=60.0
-                    )
-                    self.last_speakers.append(player.name)
-                except asyncio.TimeoutError:
-                    # Log timeout and continue with next player
+            player_prompt = f"Respond to DM's message: {dm_response.text}"
+            results = await self._collect_player_responses(responders, player_prompt)
+
+            # Record speakers in priority order, not completion order
+            for player, result in zip(responders, results):
+                if isinstance(result, asyncio.TimeoutError):
+                    # Log timeout (other players are unaffected)
                     error_msg = f"⚠️ {player.name} failed to respond within timeout (60s)"
-                    print(error_msg)
+                    log.warning(error_msg)
                     await self.memory.board.post(
                         Message("System", error_msg, metadata={"type": "error"})
                     )
-                except Exception as e:
-                    # Log other errors and continue
-                    error_msg = f"⚠️ Error from {player.name}: {str(e)}"
-                    print(error_msg)
+                elif isinstance(result, Exception):
+                    # Log other errors
+                    error_msg = f"⚠️ Error from {player.name}: {str(result)}"
+                    log.warning(error_msg)
                     await self.memory.board.post(
                         Message("System", error_msg, metadata={"type": "error"})
                     )
+                else:
+                    if self.parallel_players:
+                        await self.memory.post_response(player.name, result)
+                    self.last_speakers.append(player.name)
 
-                # Optional: DM can react immediately to critical actions
-                # (implement if needed)
+            # Optional: DM can react immediately to critical actions
+            # (implement if needed)
 
             # Optional: Update game state snapshot
             # self.memory.update_context_snapshot({...})
@@ -149,6 +177,39 @@ class GameOrchestrator:
             )
         )
 
+    async def _collect_player_responses(self, responders: List[Agent], prompt: str) -> List:
+        """
+        Get each responder's reply, in responder order.
+
+        In parallel mode all calls run concurrently and nothing is posted yet;
+        the caller posts replies in priority order, not completion order.
+        Serial mode posts each reply before the next player is asked.
+
+        Returns:
+            One response or exception per responder
+        """
+        if self.parallel_players and len(responders) > 1:
+            return await asyncio.gather(
+                *[
+                    self.memory.agent_respond(
+                        player.name, player, prompt, timeout=60.0, post_to_board=False
+                    )
+                    for player in responders
+                ],
+                return_exceptions=True
+            )
+
+        results = []
+        for player in responders:
+            try:
+                results.append(await self.memory.agent_respond(
+                    player.name, player, prompt, timeout=60.0,
+                    post_to_board=not self.parallel_players
+                ))
+            except Exception as e:
+                results.append(e)
+        return results
+
     async def _determine_responders(
         self,
         intent: DMIntent,
@@ -170,21 +231,23 @@ class GameOrchestrator:
             return [player] if player else []
 
         elif intent.type == IntentType.OPEN:
-            # Gather intents in parallel
-            intent_tasks = [
-                generate_player_intent(
-                    player,
-                    dm_message,
-                    self.memory.board.get_context_window(max_messages=10)
-                )
-                for player in self.players
-            ]
-            player_intents = await asyncio.gather(*intent_tasks)
+            # Gather all intents in one request
+            player_intents = await generate_player_intents_batch(
+                self.players,
+                dm_message,
+                self.memory.board.get_context_window(max_messages=10),
+                self.intent_client
+            )
 
             # Smart ordering
-            ordered_names = smart_order_players(player_intents, self.last_speakers)
-            responders = [self.get_player(name) for name in ordered_names]
-            return [r for r in responders if r is not None]
+            ordered_names = smart_order_players(
+                player_intents, list(self.last_speakers), top_k=self.speak_top_k
+            )
+            return [
+                self._players_by_name[name]
+                for name in ordered_names
+                if name in self._players_by_name
+            ]
 
         elif intent.type == IntentType.INITIATIVE:
             # Initiative order (simplified - all players respond)
@@ -203,10 +266,7 @@ class GameOrchestrator:
         Returns:
             Agent if found, None otherwise
         """
-        for player in self.players:
-            if player.name == name:
-                return player
-        return None
+        return self._players_by_name.get(name)
 
     def stop(self):
         """Stop the game loop"""
@@ -227,7 +287,7 @@ class GameOrchestrator:
         Returns:
             List of all messages from the board
         """
-        return self.memory.board.messages
+        return list(self.memory.board.messages)
 
     def get_recent_transcript(self, n: int = 10) -> List[Message]:
         """
@@ -0,0 +1,189 @@
+"""
+Answer cache for the D&D RAG system.
+
+This module handles:
+- LRU + TTL caching of generated answers per (collection, k, query)
+- Semantic lookups: near-duplicate queries match by embedding similarity
+- Hit/miss statistics (reported by the server's /health endpoint)
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+QUERY_CACHE_SIZE = 2048       # Maximum cached answers
+QUERY_CACHE_TTL = 600.0       # Seconds before an answer expires
+SEMANTIC_THRESHOLD = 0.97     # Minimum cosine similarity for a semantic hit
+
+
+class QueryCache:
+    """
+    Thread-safe LRU + TTL cache of RAG answers.
+
+    Exact lookups use a hash of the normalized query. Entries stored with a
+    query embedding can also be found by cosine similarity; the embeddings of
+    each (collection, k) group are stacked into a matrix that is rebuilt
+    lazily after the group changes.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = QUERY_CACHE_SIZE,
+        ttl: float = QUERY_CACHE_TTL,
+        threshold: float = SEMANTIC_THRESHOLD
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (expires_at, answer, unit vector)
+        self._matrices: Dict[Tuple[str, int], Tuple[List[tuple], np.ndarray]] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(collection_name: str, k: int, query: str) -> tuple:
+        """Cache key for a query (case and surrounding whitespace ignored)"""
+        digest = hashlib.sha256(query.strip().lower().encode("utf-8")).hexdigest()
+        return (collection_name, k, digest)
+
+    def get(self, collection_name: str, k: int, query: str) -> Optional[str]:
+        """
+        Exact lookup.
+
+        Returns:
+            Cached answer, or None on miss/expiry
+        """
+        key = self.make_key(collection_name, k, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def get_similar(self, collection_name: str, k: int, vector: List[float]) -> Optional[str]:
+        """
+        Semantic lookup by query embedding.
+
+        Returns:
+            Answer of the most similar live entry above the threshold, or None
+        """
+        query_vec = _unit(vector)
+        if query_vec is None:
+            return None
+
+        with self._lock:
+            group = (collection_name, k)
+            cached = self._matrices.get(group)
+            if cached is None:
+                keys = [
+                    key for key, entry in self._entries.items()
+                    if key[:2] == group and entry[2] is not None
+                ]
+                if not keys:
+                    return None
+                cached = (keys, np.stack([self._entries[key][2] for key in keys]))
+                self._matrices[group] = cached
+
+            keys, matrix = cached
+            scores = matrix @ query_vec
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+
+            key = keys[best]
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(
+        self,
+        collection_name: str,
+        k: int,
+        query: str,
+        answer: str,
+        vector: Optional[List[float]] = None
+    ) -> None:
+        """
+        Store an answer (optionally with the query embedding for semantic hits).
+
+        Args:
+            collection_name: Collection the answer was retrieved from
+            k: Number of chunks used
+            query: Original query
+            answer: Generated answer
+            vector: Optional query embedding
+        """
+        key = self.make_key(collection_name, k, query)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, answer, _unit(vector))
+            self._matrices.pop(key[:2], None)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def record(self, hit: bool) -> None:
+        """Count one query as a cache hit or miss"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, hit_rate and size
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._matrices.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _remove(self, key: tuple) -> None:
+        """Remove an entry and invalidate its group's matrix (lock held)"""
+        del self._entries[key]
+        self._matrices.pop(key[:2], None)
+
+
+def _unit(vector: Optional[List[float]]) -> Optional[np.ndarray]:
+    """Normalize a vector to unit length (None if missing or zero)"""
+    if vector is None:
+        return None
+    arr = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(arr))
+    if norm == 0.0:
+        return None
+    return arr / norm
+
+
+# Shared cache used by the retrieval functions
+query_cache = QueryCache()
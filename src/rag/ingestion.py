@@ -4,12 +4,20 @@ Document ingestion pipeline for D&D RAG system.
 This module handles:
 - Loading D&D documents (rules, monsters, adventures)
 - Parsing and chunking documents
-- Generating embeddings
+- Generating embeddings (synchronously or via the OpenAI Batch API)
 - Storing in Qdrant vector collections
 """
 
+import hashlib
+import io
+import json
 import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional
 
 from datapizza.core.vectorstore import VectorConfig
 from datapizza.embedders import ChunkEmbedder
@@ -17,7 +25,9 @@ from datapizza.embedders.openai import OpenAIEmbedder
 from datapizza.modules.parsers import TextParser
 from datapizza.modules.splitters import NodeSplitter
 from datapizza.pipeline import IngestionPipeline
+from datapizza.type import Chunk, DenseEmbedding
 from datapizza.vectorstores.qdrant import QdrantVectorstore
+from qdrant_client import models
 
 from src.config import (
     COLLECTION_ADVENTURE,
@@ -26,18 +36,78 @@ from src.config import (
     EMBEDDING_MODEL,
     OPENAI_API_KEY,
     QDRANT_LOCATION,
+    QUANTIZED_COLLECTIONS,
 )
+from src.http_pool import get_sdk_client, share_connection_pool
+
+
+# Documents to ingest: file name, target collection and chunk metadata
+DOCUMENTS = [
+    {
+        "file": "dnd_basic_rules.md",
+        "collection": COLLECTION_RULES,
+        "metadata": {
+            "source": "D&D 5e Basic Rules",
+            "type": "rules",
+            "access": "all",
+            "description": "Core D&D 5e mechanics and rules"
+        }
+    },
+    {
+        "file": "monsters.md",
+        "collection": COLLECTION_MONSTERS,
+        "metadata": {
+            "source": "Monster Stat Blocks",
+            "type": "monsters",
+            "access": "dm_only",
+            "description": "Monster statistics and abilities"
+        }
+    },
+    {
+        "file": "starter_adventure.md",
+        "collection": COLLECTION_ADVENTURE,
+        "metadata": {
+            "source": "The Forgotten Crypt",
+            "type": "narrative",
+            "access": "dm_only",
+            "description": "Level 1 adventure for 3-5 players"
+        }
+    }
+]
+
+# Documents are read in windows of about this many characters, cut at
+# markdown section/paragraph boundaries (current documents fit in one window)
+DOCUMENT_WINDOW_CHARS = 1_000_000
+
+# (collection, chunk_size) -> chunk+embed pipeline, reused across documents
+_PIPELINES: Dict[tuple, IngestionPipeline] = {}
 
+# Points per Qdrant upsert request
+UPSERT_BATCH_SIZE = 256
 
-def create_vectorstore() -> QdrantVectorstore:
+# Written into a persistent store after a complete ingestion
+MANIFEST_NAME = "manifest.json"
+
+# Batch API terminal states
+_BATCH_DONE_STATES = {"completed", "failed", "expired", "cancelled"}
+
+
+def create_vectorstore(storage_path: Optional[str] = None) -> QdrantVectorstore:
     """
     Create and initialize Qdrant vectorstore.
 
+    Args:
+        storage_path: Optional directory for an on-disk local store
+            (default: QDRANT_LOCATION)
+
     Returns:
         QdrantVectorstore: Configured vectorstore instance
     """
     print("📦 Initializing Qdrant vectorstore...")
-    vectorstore = QdrantVectorstore(location=QDRANT_LOCATION)
+    if storage_path is not None:
+        vectorstore = QdrantVectorstore(location=None, path=str(storage_path))
+    else:
+        vectorstore = QdrantVectorstore(location=QDRANT_LOCATION)
 
     # Create 3 collections for different document types
     collections = [
@@ -58,19 +128,52 @@ def create_vectorstore() -> QdrantVectorstore:
             # Collection might already exist
             print(f"  ℹ️  Collection {collection_name} already exists or error: {e}")
 
+        if QDRANT_LOCATION != ":memory:" and collection_name in QUANTIZED_COLLECTIONS:
+            tune_collection(vectorstore, collection_name)
+
     return vectorstore
 
 
+def tune_collection(vectorstore: QdrantVectorstore, collection_name: str) -> None:
+    """
+    Enable int8 scalar quantization and HNSW tuning on a server collection.
+
+    Quantized vectors are kept in RAM for the first search pass; queries
+    rescore the oversampled candidates against the original vectors (see
+    search_params() in retrieval.py).
+
+    Args:
+        vectorstore: Vectorstore backed by a Qdrant server
+        collection_name: Collection to update
+    """
+    try:
+        vectorstore.get_client().update_collection(
+            collection_name,
+            quantization_config=models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True
+                )
+            ),
+            hnsw_config=models.HnswConfigDiff(m=16, ef_construct=128)
+        )
+        print(f"  ⚡ Enabled int8 quantization for {collection_name}")
+    except Exception as e:
+        print(f"  ⚠️  Could not tune collection {collection_name}: {e}")
+
+
 def create_ingestion_pipeline(
-    vectorstore: QdrantVectorstore,
-    collection_name: str,
+    vectorstore: Optional[QdrantVectorstore] = None,
+    collection_name: Optional[str] = None,
     chunk_size: int = 1000
 ) -> IngestionPipeline:
     """
     Create an ingestion pipeline for processing documents.
 
     Args:
-        vectorstore: Qdrant vectorstore instance
+        vectorstore: Qdrant vectorstore instance (None = return embedded chunks
+            instead of storing them, see store_chunks())
         collection_name: Target collection for ingestion
         chunk_size: Maximum characters per chunk (default: 1000)
 
@@ -79,10 +182,10 @@ def create_ingestion_pipeline(
     """
     # Create embedder
     embedder = ChunkEmbedder(
-        client=OpenAIEmbedder(
+        client=share_connection_pool(OpenAIEmbedder(
             api_key=OPENAI_API_KEY,
             model_name=EMBEDDING_MODEL
-        ),
+        )),
         embedding_name="embedding"  # Must match VectorConfig name
     )
 
@@ -100,6 +203,80 @@ def create_ingestion_pipeline(
     return pipeline
 
 
+def get_ingestion_pipeline(collection_name: str, chunk_size: int = 1000) -> IngestionPipeline:
+    """
+    Get (or create) the chunk+embed pipeline for a collection.
+
+    Pipelines, with their embedder and HTTP client, are built once per
+    collection and chunk size and reused for every document ingested there.
+    They return embedded chunks; store them with store_chunks().
+
+    Args:
+        collection_name: Target collection for ingestion
+        chunk_size: Maximum characters per chunk (default: 1000)
+
+    Returns:
+        IngestionPipeline: Cached pipeline instance
+    """
+    key = (collection_name, chunk_size)
+    pipeline = _PIPELINES.get(key)
+    if pipeline is None:
+        pipeline = create_ingestion_pipeline(chunk_size=chunk_size)
+        _PIPELINES[key] = pipeline
+    return pipeline
+
+
+def store_chunks(
+    vectorstore: QdrantVectorstore,
+    chunks: List[Chunk],
+    collection_name: str,
+    batch_size: int = UPSERT_BATCH_SIZE
+) -> None:
+    """
+    Upsert embedded chunks in batches.
+
+    QdrantVectorstore.add() sends one upsert request per chunk; this sends
+    one per batch_size chunks.
+
+    Args:
+        vectorstore: Qdrant vectorstore instance
+        chunks: Chunks with embeddings
+        collection_name: Target collection
+        batch_size: Points per upsert request
+    """
+    client = vectorstore.get_client()
+    for start in range(0, len(chunks), batch_size):
+        points = [vectorstore._process_chunk(chunk) for chunk in chunks[start:start + batch_size]]
+        client.upsert(collection_name=collection_name, points=points, wait=True)
+
+
+def iter_document_windows(file_path: str, window_chars: int = DOCUMENT_WINDOW_CHARS) -> Iterator[str]:
+    """
+    Stream a text document in windows of roughly window_chars characters.
+
+    Windows are only cut right before a markdown heading or blank line, so
+    sections and paragraphs are never split between two windows.
+
+    Args:
+        file_path: Path to document file
+        window_chars: Target window size in characters
+
+    Yields:
+        Consecutive text windows covering the whole file
+    """
+    buffer: List[str] = []
+    buffered = 0
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if buffered >= window_chars and (line.startswith("#") or not line.strip()):
+                yield "".join(buffer)
+                buffer, buffered = [], 0
+            buffer.append(line)
+            buffered += len(line)
+    if buffer:
+        yield "".join(buffer)
+
+
 def ingest_document(
     file_path: str,
     vectorstore: QdrantVectorstore,
@@ -117,20 +294,23 @@ def ingest_document(
         metadata: Document metadata
         chunk_size: Maximum characters per chunk
     """
-    # Read file content
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Reuse the pipeline for this collection
+    pipeline = get_ingestion_pipeline(collection_name, chunk_size)
 
-    # Create pipeline for this collection
-    pipeline = create_ingestion_pipeline(vectorstore, collection_name, chunk_size)
-
-    # Ingest document
+    # Ingest document window by window (never holds the whole file)
     print(f"  📄 Ingesting: {Path(file_path).name}")
     print(f"     Collection: {collection_name}")
-    print(f"     Size: {len(content)} characters")
 
-    # Run ingestion
-    pipeline.run(content, metadata=metadata)
+    size = 0
+    for window_index, window in enumerate(iter_document_windows(file_path)):
+        size += len(window)
+        chunks = pipeline.run(window)
+        for chunk in chunks:
+            chunk.metadata.update(metadata)
+            chunk.metadata["window"] = window_index
+        store_chunks(vectorstore, chunks, collection_name)
+
+    print(f"     Size: {size} characters")
 
     # Get collection stats
     try:
@@ -140,20 +320,93 @@ def ingest_document(
         print(f"     ⚠️  Could not get collection stats: {e}")
 
 
+def documents_digest(documents_dir: str, chunk_size: int) -> str:
+    """
+    SHA-256 over the source documents and the settings that shape their chunks.
+
+    Args:
+        documents_dir: Directory containing D&D documents
+        chunk_size: Maximum characters per chunk
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256(f"{EMBEDDING_MODEL}\0{chunk_size}".encode("utf-8"))
+    for doc_info in DOCUMENTS:
+        digest.update(f"\0{doc_info['file']}\0{doc_info['collection']}\0".encode("utf-8"))
+        try:
+            digest.update(Path(documents_dir, doc_info["file"]).read_bytes())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def _read_manifest(storage_path: Path) -> Optional[str]:
+    """Digest recorded by the last complete ingestion into storage_path"""
+    try:
+        return json.loads((storage_path / MANIFEST_NAME).read_text(encoding="utf-8")).get("sha256")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
 def ingest_documents(
     documents_dir: str = "data/documents",
-    chunk_size: int = 1000
+    chunk_size: int = 1000,
+    batch: bool = False,
+    storage_path: Optional[str] = None
 ) -> QdrantVectorstore:
     """
     Ingest all D&D documents into the RAG system.
 
+    With storage_path, the vectorstore is kept on disk next to a manifest of
+    the documents' SHA-256. Later calls with unchanged documents reopen it
+    instead of re-embedding; any change rebuilds it from scratch.
+
     Args:
         documents_dir: Directory containing D&D documents
         chunk_size: Maximum characters per chunk (default: 1000)
+        batch: Embed through the OpenAI Batch API (cheaper, not interactive)
+        storage_path: Optional directory for a persistent local vectorstore
 
     Returns:
         QdrantVectorstore: Populated vectorstore instance
     """
+    if storage_path is not None:
+        storage_path = Path(storage_path)
+        digest = documents_digest(documents_dir, chunk_size)
+        if _read_manifest(storage_path) == digest:
+            print(f"⚡ Documents unchanged, reusing vectorstore at {storage_path}")
+            return QdrantVectorstore(location=None, path=str(storage_path))
+
+        # Stale or partial store: start over so chunks are not duplicated
+        shutil.rmtree(storage_path, ignore_errors=True)
+        storage_path.mkdir(parents=True)
+
+        if batch:
+            vectorstore = ingest_documents_batch(documents_dir, chunk_size, storage_path=storage_path)
+        else:
+            vectorstore = _ingest_documents(documents_dir, chunk_size, storage_path)
+
+        # Per-document errors are only logged: don't reuse a store missing a collection
+        if all(
+            vectorstore.get_client().count(doc_info["collection"]).count > 0
+            for doc_info in DOCUMENTS
+        ):
+            (storage_path / MANIFEST_NAME).write_text(json.dumps({"sha256": digest}), encoding="utf-8")
+        return vectorstore
+
+    if batch:
+        return ingest_documents_batch(documents_dir, chunk_size)
+    return _ingest_documents(documents_dir, chunk_size)
+
+
+def _ingest_documents(
+    documents_dir: str,
+    chunk_size: int,
+    storage_path: Optional[Path] = None
+) -> QdrantVectorstore:
+    """Embed and store all documents synchronously (see ingest_documents)"""
+
     print("\n" + "="*60)
     print("🎲 D&D RAG SYSTEM - DOCUMENT INGESTION")
     print("="*60 + "\n")
@@ -163,52 +416,23 @@ def ingest_documents(
         raise ValueError("OPENAI_API_KEY not found in environment variables")
 
     # Create vectorstore and collections
-    vectorstore = create_vectorstore()
-
-    # Define documents to ingest
-    documents = [
-        {
-            "file": "dnd_basic_rules.md",
-            "collection": COLLECTION_RULES,
-            "metadata": {
-                "source": "D&D 5e Basic Rules",
-                "type": "rules",
-                "access": "all",
-                "description": "Core D&D 5e mechanics and rules"
-            }
-        },
-        {
-            "file": "monsters.md",
-            "collection": COLLECTION_MONSTERS,
-            "metadata": {
-                "source": "Monster Stat Blocks",
-                "type": "monsters",
-                "access": "dm_only",
-                "description": "Monster statistics and abilities"
-            }
-        },
-        {
-            "file": "starter_adventure.md",
-            "collection": COLLECTION_ADVENTURE,
-            "metadata": {
-                "source": "The Forgotten Crypt",
-                "type": "narrative",
-                "access": "dm_only",
-                "description": "Level 1 adventure for 3-5 players"
-            }
-        }
-    ]
+    vectorstore = create_vectorstore(storage_path)
 
     print(f"📂 Document directory: {documents_dir}\n")
 
-    # Ingest each document
-    for doc_info in documents:
+    # Collect documents to ingest
+    jobs = []
+    for doc_info in DOCUMENTS:
         file_path = os.path.join(documents_dir, doc_info["file"])
 
         if not os.path.exists(file_path):
             print(f"  ⚠️  File not found: {file_path}")
             continue
 
+        jobs.append((doc_info, file_path))
+
+    def ingest(job):
+        doc_info, file_path = job
         try:
             ingest_document(
                 file_path=file_path,
@@ -221,7 +445,19 @@ def ingest_documents(
         except Exception as e:
             print(f"  ❌ Error ingesting {doc_info['file']}: {e}\n")
 
-    # Print summary
+    # Collections already exist, so documents (one per collection) can be
+    # embedded and stored concurrently
+    if jobs:
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            list(pool.map(ingest, jobs))
+
+    _print_summary(vectorstore)
+
+    return vectorstore
+
+
+def _print_summary(vectorstore: QdrantVectorstore) -> None:
+    """Print vector counts for all collections"""
     print("="*60)
     print("📊 INGESTION SUMMARY")
     print("="*60)
@@ -235,9 +471,141 @@ def ingest_documents(
 
     print("\n✅ Document ingestion complete!\n")
 
+
+def chunk_document(content: str, metadata: dict, chunk_size: int = 1000) -> List[Chunk]:
+    """
+    Parse and split a document locally, without embedding it.
+
+    Args:
+        content: Document text
+        metadata: Metadata added to every chunk
+        chunk_size: Maximum characters per chunk
+
+    Returns:
+        List of chunks (no embeddings yet)
+    """
+    pipeline = IngestionPipeline(
+        modules=[
+            TextParser(),
+            NodeSplitter(max_char=chunk_size),
+        ]
+    )
+    chunks = pipeline.run(content)
+    for chunk in chunks:
+        chunk.metadata.update(metadata)
+    return chunks
+
+
+def ingest_documents_batch(
+    documents_dir: str = "data/documents",
+    chunk_size: int = 1000,
+    poll_interval: float = 30.0,
+    storage_path: Optional[Path] = None
+) -> QdrantVectorstore:
+    """
+    Ingest all D&D documents, embedding every chunk in one OpenAI batch job.
+
+    Chunks from all collections are submitted as a single Batch API job
+    (half the price of synchronous embedding calls), then written to their
+    collections once the job completes. Completion can take up to 24h, so
+    this is meant for offline ingestion only.
+
+    Args:
+        documents_dir: Directory containing D&D documents
+        chunk_size: Maximum characters per chunk (default: 1000)
+        poll_interval: Seconds between batch status checks
+        storage_path: Optional directory for an on-disk local store
+
+    Returns:
+        QdrantVectorstore: Populated vectorstore instance
+    """
+    print("\n" + "="*60)
+    print("🎲 D&D RAG SYSTEM - BATCH DOCUMENT INGESTION")
+    print("="*60 + "\n")
+
+    if not OPENAI_API_KEY:
+        raise ValueError("OPENAI_API_KEY not found in environment variables")
+
+    vectorstore = create_vectorstore(storage_path)
+    client = get_sdk_client(OPENAI_API_KEY)
+
+    # 1. Chunk all documents locally
+    chunks_by_collection: Dict[str, List[Chunk]] = {}
+    for doc_info in DOCUMENTS:
+        file_path = os.path.join(documents_dir, doc_info["file"])
+        if not os.path.exists(file_path):
+            print(f"  ⚠️  File not found: {file_path}")
+            continue
+
+        chunks = []
+        for window_index, window in enumerate(iter_document_windows(file_path)):
+            chunks.extend(chunk_document(window, {**doc_info["metadata"], "window": window_index}, chunk_size))
+        chunks_by_collection.setdefault(doc_info["collection"], []).extend(chunks)
+        print(f"  📄 Chunked: {doc_info['file']} ({len(chunks)} chunks)")
+
+    if not chunks_by_collection:
+        print("  ⚠️  No documents to ingest")
+        return vectorstore
+
+    # 2. One /v1/embeddings request per chunk, tagged "<collection>:<index>"
+    lines = []
+    for collection, chunks in chunks_by_collection.items():
+        for idx, chunk in enumerate(chunks):
+            lines.append(json.dumps({
+                "custom_id": f"{collection}:{idx}",
+                "method": "POST",
+                "url": "/v1/embeddings",
+                "body": {"model": EMBEDDING_MODEL, "input": chunk.text}
+            }))
+    payload = io.BytesIO(("\n".join(lines) + "\n").encode("utf-8"))
+
+    # 3-4. Upload requests and start the batch job
+    input_file = client.files.create(file=("embeddings.jsonl", payload), purpose="batch")
+    job = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/embeddings",
+        completion_window="24h"
+    )
+    print(f"\n  ⏳ Submitted batch {job.id} ({len(lines)} chunks)")
+
+    # 5. Poll until the job finishes
+    while job.status not in _BATCH_DONE_STATES:
+        time.sleep(poll_interval)
+        job = client.batches.retrieve(job.id)
+        print(f"     Status: {job.status}")
+
+    if job.status != "completed" or not job.output_file_id:
+        raise RuntimeError(f"Embedding batch {job.id} ended with status '{job.status}'")
+
+    # 6. Attach embeddings and store each collection
+    output = client.files.content(job.output_file_id).text
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        collection, idx = result["custom_id"].rsplit(":", 1)
+        response = result.get("response") or {}
+        if response.get("status_code") != 200:
+            print(f"  ⚠️  Embedding failed for {result['custom_id']}: {result.get('error')}")
+            continue
+        vector = response["body"]["data"][0]["embedding"]
+        chunks_by_collection[collection][int(idx)].embeddings.append(
+            DenseEmbedding(name="embedding", vector=vector)  # Must match VectorConfig name
+        )
+
+    print()
+    for collection, chunks in chunks_by_collection.items():
+        embedded = [chunk for chunk in chunks if chunk.embeddings]
+        if embedded:
+            store_chunks(vectorstore, embedded, collection)
+        print(f"  ✅ {collection}: stored {len(embedded)}/{len(chunks)} chunks")
+    print()
+
+    _print_summary(vectorstore)
+
     return vectorstore
 
 
 if __name__ == "__main__":
-    # Run ingestion when script is executed directly
-    vectorstore = ingest_documents()
+    # Run ingestion when script is executed directly (--batch: OpenAI Batch API)
+    vectorstore = ingest_documents(batch="--batch" in sys.argv)
@@ -5,17 +5,29 @@ This module handles:
 - Query rewriting for better retrieval
 - Vector similarity search
 - Context-aware response generation
+- Micro-batching of concurrent tool queries (one embedding + Qdrant call)
+- Query embedding reuse across collections
+- Answer caching (exact and semantic, see cache.py)
+- Prompt assembly with plain string joins (no per-query Jinja rendering)
 """
 
-from typing import Optional
+import asyncio
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional
 
+import numpy as np
 from datapizza.clients.openai_like import OpenAILikeClient
 from datapizza.embedders.openai import OpenAIEmbedder
 from datapizza.modules.prompt import ChatPromptTemplate
 from datapizza.modules.rewriters import ToolRewriter
 from datapizza.pipeline import DagPipeline
 from datapizza.tools import tool
+from datapizza.type import Chunk
 from datapizza.vectorstores.qdrant import QdrantVectorstore
+from qdrant_client import models
 
 from src.config import (
     COLLECTION_ADVENTURE,
@@ -27,38 +39,167 @@ from src.config import (
     OPENAI_API_KEY,
     QDRANT_LOCATION,
 )
+from src.game_log import get_logger
+from src.http_pool import share_connection_pool
+from src.rag.cache import query_cache
+from src.tools.dice import DICE_RE, roll_dice
 
+log = get_logger("rag")
 
-# Global pipeline instance (initialized on first use)
-_retrieval_pipeline: Optional[DagPipeline] = None
-_vectorstore: Optional[QdrantVectorstore] = None
 
+# HNSW beam width for server searches, scaled with k (the collections are small)
+HNSW_EF_MIN = 32
+HNSW_EF_PER_K = 16
 
-def initialize_retrieval_pipeline(vectorstore: Optional[QdrantVectorstore] = None) -> tuple[DagPipeline, QdrantVectorstore]:
+
+@lru_cache(maxsize=16)
+def search_params(k: int) -> Optional[models.SearchParams]:
     """
-    Initialize the RAG retrieval pipeline with query rewriting.
+    Search params for a top-k query on a server collection.
+
+    A narrow HNSW beam for single-chunk lookups, wider for larger k, and
+    rescoring of oversampled int8 candidates with the original vectors.
+    Local mode only does exact search, so it gets no params.
 
     Args:
-        vectorstore: Optional existing vectorstore to reuse (for in-memory mode)
+        k: Number of chunks requested
 
     Returns:
-        tuple: (DagPipeline, QdrantVectorstore) instances
+        SearchParams, or None in local mode
     """
-    print("🔧 Initializing RAG retrieval pipeline...")
+    if QDRANT_LOCATION == ":memory:":
+        return None
+    return models.SearchParams(
+        hnsw_ef=max(HNSW_EF_MIN, HNSW_EF_PER_K * k),
+        quantization=models.QuantizationSearchParams(rescore=True, oversampling=2.0)
+    )
+
+# Only the chunk text is used to build the prompt; skip the rest of the payload
+_PROMPT_PAYLOAD = models.PayloadSelectorInclude(include=["text"])
+
+# Retrieved chunks more similar than this to a better-ranked chunk are dropped
+DUPLICATE_CHUNK_THRESHOLD = 0.92
 
+# Global pipeline instance (initialized on first use)
+_retrieval_pipeline: Optional[DagPipeline] = None
+_vectorstore: Optional[QdrantVectorstore] = None
+
+# id(vectorstore) -> (pipeline, vectorstore); holding the store keeps its id unique
+_pipelines_by_store: Dict[int, tuple[DagPipeline, QdrantVectorstore]] = {}
+
+# Serializes pipeline creation: concurrent first queries (worker threads, the
+# server warm-up) must not each build their own pipeline
+_pipeline_lock = threading.Lock()
+
+# (embedding model, query) -> query embedding, so asking the same question of
+# several collections embeds it once
+QUERY_VECTOR_CACHE_SIZE = 256
+_query_vectors: "OrderedDict[tuple, List[float]]" = OrderedDict()
+_query_vectors_lock = threading.Lock()
+
+
+def _get_query_vector(query: str) -> Optional[List[float]]:
+    """Cached embedding of a query, or None"""
+    key = (EMBEDDING_MODEL, query)
+    with _query_vectors_lock:
+        vector = _query_vectors.get(key)
+        if vector is not None:
+            _query_vectors.move_to_end(key)
+        return vector
+
+
+def _put_query_vector(query: str, vector: List[float]) -> None:
+    """Remember a query embedding (LRU-bounded)"""
+    with _query_vectors_lock:
+        _query_vectors[(EMBEDDING_MODEL, query)] = vector
+        _query_vectors.move_to_end((EMBEDDING_MODEL, query))
+        while len(_query_vectors) > QUERY_VECTOR_CACHE_SIZE:
+            _query_vectors.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def _build_static_modules() -> tuple[OpenAILikeClient, OpenAIEmbedder, ChatPromptTemplate]:
+    """
+    Build the pipeline modules that don't depend on the vectorstore (once).
+
+    Returns:
+        tuple: (generator client, query embedder, prompt template)
+    """
     # Create Groq client for fast inference (using OpenAI-like API)
-    groq_client = OpenAILikeClient(
+    groq_client = share_connection_pool(OpenAILikeClient(
         api_key=GROQ_API_KEY,
         model=GROQ_MODEL,
         base_url="https://api.groq.com/openai/v1",
         temperature=0.7
-    )
+    ))
 
     # Create OpenAI embedder
-    embedder = OpenAIEmbedder(
+    embedder = share_connection_pool(OpenAIEmbedder(
         api_key=OPENAI_API_KEY,
         model_name=EMBEDDING_MODEL
-    )
+    ))
+
+    # Prompt builder (format context for LLM)
+    prompt_template = _RetrievalPromptTemplate()
+
+    return groq_client, embedder, prompt_template
+
+
+_RETRIEVAL_PROMPT_FOOTER = (
+    "---\n\n"
+    "Answer the question using ONLY the information provided in the context above. "
+    "If the context doesn't contain enough information, say so. "
+    "Be concise and accurate. Cite specific rules or stat blocks when relevant."
+)
+
+
+class _QuestionTemplate:
+    """Renders the user prompt ("Question: ...") without Jinja"""
+
+    def render(self, user_prompt: str = "") -> str:
+        return f"Question: {user_prompt}"
+
+
+class _ContextTemplate:
+    """Renders the retrieved chunks as a "---"-separated context block without Jinja"""
+
+    def render(self, chunks: List[Chunk]) -> str:
+        parts = ["Context from D&D documents:\n"]
+        for chunk in chunks:
+            parts.append(f"---\n{chunk.text}\n")
+        parts.append(_RETRIEVAL_PROMPT_FOOTER)
+        return "".join(parts)
+
+
+class _RetrievalPromptTemplate(ChatPromptTemplate):
+    """
+    ChatPromptTemplate with the D&D prompts built by plain string joins.
+
+    Produces the same memory as the equivalent Jinja templates, without
+    running a template per query.
+    """
+
+    def __init__(self):
+        self.user_prompt_template = _QuestionTemplate()
+        self.retrieval_prompt_template = _ContextTemplate()
+
+
+def initialize_retrieval_pipeline(vectorstore: Optional[QdrantVectorstore] = None) -> tuple[DagPipeline, QdrantVectorstore]:
+    """
+    Initialize the RAG retrieval pipeline with query rewriting.
+
+    Clients, embedder and prompt template are shared by every pipeline; only
+    the retriever differs per vectorstore.
+
+    Args:
+        vectorstore: Optional existing vectorstore to reuse (for in-memory mode)
+
+    Returns:
+        tuple: (DagPipeline, QdrantVectorstore) instances
+    """
+    log.debug("🔧 Initializing RAG retrieval pipeline...")
+
+    groq_client, embedder, prompt_template = _build_static_modules()
 
     # Use provided vectorstore or create new one
     if vectorstore is None:
@@ -89,23 +230,7 @@ def initialize_retrieval_pipeline(vectorstore: Optional[QdrantVectorstore] = Non
     dag_pipeline.add_module("retriever", vectorstore)
 
     # Module 4: Prompt Builder (format context for LLM)
-    dag_pipeline.add_module(
-        "prompt",
-        ChatPromptTemplate(
-            user_prompt_template="Question: {{user_prompt}}",
-            retrieval_prompt_template=(
-                "Context from D&D documents:\n"
-                "{% for chunk in chunks %}"
-                "---\n"
-                "{{ chunk.text }}\n"
-                "{% endfor %}"
-                "---\n\n"
-                "Answer the question using ONLY the information provided in the context above. "
-                "If the context doesn't contain enough information, say so. "
-                "Be concise and accurate. Cite specific rules or stat blocks when relevant."
-            )
-        )
-    )
+    dag_pipeline.add_module("prompt", prompt_template)
 
     # Module 5: Generator (produce final answer)
     dag_pipeline.add_module("generator", groq_client)
@@ -116,7 +241,7 @@ def initialize_retrieval_pipeline(vectorstore: Optional[QdrantVectorstore] = Non
     dag_pipeline.connect("retriever", "prompt", target_key="chunks")
     dag_pipeline.connect("prompt", "generator", target_key="memory")
 
-    print("  ✅ Pipeline initialized successfully\n")
+    log.debug("  ✅ Pipeline initialized successfully\n")
 
     return dag_pipeline, vectorstore
 
@@ -125,21 +250,91 @@ def get_retrieval_pipeline(vectorstore: Optional[QdrantVectorstore] = None) -> t
     """
     Get or create the retrieval pipeline (singleton pattern).
 
+    Pipelines are memoized per vectorstore, so passing the same store on
+    every query does not rebuild anything.
+
     Args:
-        vectorstore: Optional existing vectorstore to reuse
+        vectorstore: Optional existing vectorstore to reuse (becomes the default)
 
     Returns:
         tuple: (DagPipeline, QdrantVectorstore) instances
     """
     global _retrieval_pipeline, _vectorstore
 
-    # If vectorstore is provided, reinitialize with that vectorstore
-    if vectorstore is not None:
-        _retrieval_pipeline, _vectorstore = initialize_retrieval_pipeline(vectorstore)
-    elif _retrieval_pipeline is None or _vectorstore is None:
-        _retrieval_pipeline, _vectorstore = initialize_retrieval_pipeline()
+    with _pipeline_lock:
+        # If vectorstore is provided, switch to (and cache) its pipeline
+        if vectorstore is not None:
+            cached = _pipelines_by_store.get(id(vectorstore))
+            if cached is None:
+                cached = initialize_retrieval_pipeline(vectorstore)
+                _pipelines_by_store[id(vectorstore)] = cached
+            _retrieval_pipeline, _vectorstore = cached
+        elif _retrieval_pipeline is None or _vectorstore is None:
+            _retrieval_pipeline, _vectorstore = initialize_retrieval_pipeline()
 
-    return _retrieval_pipeline, _vectorstore
+        return _retrieval_pipeline, _vectorstore
+
+
+def warm_up_retrieval() -> None:
+    """
+    Build the default pipeline and open connections before the first query.
+
+    Touches the rules collection and embeds a short text so the Qdrant and
+    OpenAI connection pools are established. Failures (missing collection or
+    API key) are logged and otherwise ignored.
+    """
+    try:
+        _, vectorstore = get_retrieval_pipeline()
+    except Exception as e:
+        log.warning(f"Warm-up: retrieval pipeline not available ({e})")
+        return
+
+    try:
+        vectorstore.get_client().get_collection(COLLECTION_RULES)
+    except Exception as e:
+        log.debug(f"Warm-up: rules collection not available ({e})")
+
+    if OPENAI_API_KEY:
+        try:
+            _, embedder, _ = _build_static_modules()
+            _put_query_vector("warmup", embedder.embed("warmup"))
+        except Exception as e:
+            log.warning(f"Warm-up embedding failed: {e}")
+
+
+def _cache_scope(collection_name: str, vectorstore: QdrantVectorstore) -> str:
+    """
+    Answer-cache namespace for a collection of a specific vectorstore.
+
+    Answers built from one store are never served for another (e.g. a test
+    store). Stores stay referenced by _pipelines_by_store, so ids are stable.
+    """
+    return f"{collection_name}@{id(vectorstore):x}"
+
+
+def _shortcut_answer(query: str) -> Optional[str]:
+    """
+    Answer trivial queries without embedding or generation.
+
+    Returns:
+        A roll for bare dice notation (e.g. "d20", "1d20+5"), a canned reply
+        for empty queries, or None for anything worth a lookup (including
+        short names such as "orc")
+    """
+    text = query.strip()
+    notation = f"1{text}" if text[:1] in ("d", "D") else text  # "d20" means one die
+    if DICE_RE.fullmatch(notation.lower()):
+        return roll_dice(notation)
+    if not text:
+        return "Please ask a more specific question."
+    return None
+
+
+def _pipeline_ready(vectorstore: Optional[QdrantVectorstore] = None) -> bool:
+    """Whether get_retrieval_pipeline() would return without building anything"""
+    if vectorstore is not None:
+        return id(vectorstore) in _pipelines_by_store
+    return _retrieval_pipeline is not None and _vectorstore is not None
 
 
 def query_rag(
@@ -148,7 +343,8 @@ def query_rag(
     k: int = 3,
     use_rewriter: bool = True,
     verbose: bool = False,
-    vectorstore: Optional[QdrantVectorstore] = None
+    vectorstore: Optional[QdrantVectorstore] = None,
+    synthesize: bool = True
 ) -> str:
     """
     Query the RAG system for D&D information.
@@ -160,6 +356,8 @@ def query_rag(
         use_rewriter: Whether to use query rewriting (default: True)
         verbose: Print debug information (default: False)
         vectorstore: Optional existing vectorstore to reuse
+        synthesize: Generate an answer with the LLM (False = return the
+            retrieved chunk texts joined by blank lines, no LLM call)
 
     Returns:
         str: Generated answer based on retrieved context
@@ -168,37 +366,161 @@ def query_rag(
         >>> answer = query_rag("What are the rules for grappling?")
         >>> print(answer)
     """
-    pipeline, vectorstore = get_retrieval_pipeline(vectorstore)
+    shortcut = _shortcut_answer(query)
+    if shortcut is not None:
+        return shortcut
+
+    if not synthesize:
+        chunks = retrieve_chunks(query, collection_name, k, vectorstore)
+        return "\n\n".join(chunk.text for chunk in chunks)
+
+    _, vectorstore = get_retrieval_pipeline(vectorstore)
+    cache_scope = _cache_scope(collection_name, vectorstore)
+
+    cached = query_cache.get(cache_scope, k, query)
+    if cached is not None:
+        query_cache.record(hit=True)
+        if verbose:
+            log.info(f"⚡ Cache hit: {query}\n")
+        return cached
 
     if verbose:
-        print(f"📝 Query: {query}")
-        print(f"📚 Collection: {collection_name}")
-        print(f"🔍 Retrieving top-{k} chunks\n")
+        log.info(f"📝 Query: {query}")
+        log.info(f"📚 Collection: {collection_name}")
+        log.info(f"🔍 Retrieving top-{k} chunks\n")
 
-    # Run the pipeline
+    # Embed (unless already embedded, e.g. for another collection), search
+    # with near-duplicate removal, then generate. The DAG pipeline's retriever
+    # drops the stored vectors that deduplication needs, so it is not used here.
     try:
-        result = pipeline.run({
-            # "rewriter": {"user_prompt": query} if use_rewriter else None,  # Rewriter disabled
-            "embedder": {"text": query},  # Always use direct embedding
-            "prompt": {"user_prompt": query},
-            "retriever": {"collection_name": collection_name, "k": k},
-            "generator": {"input": query}
-        })
+        vector = _embed_query(query)
+
+        # Near-duplicate of a cached query: skip retrieval and generation
+        cached = query_cache.get_similar(cache_scope, k, vector)
+        if cached is not None:
+            query_cache.record(hit=True)
+            if verbose:
+                log.info(f"⚡ Semantic cache hit: {query}\n")
+            return cached
+
+        chunks = _search_chunks(vectorstore, collection_name, vector, k)
+        answer = answer_from_chunks(query, chunks)
 
-        answer = result['generator'].text
+        query_cache.record(hit=False)
+        query_cache.put(cache_scope, k, query, answer, vector)
 
         if verbose:
-            print(f"✅ Answer generated ({len(answer)} characters)\n")
+            log.info(f"✅ Answer generated ({len(answer)} characters)\n")
 
         return answer
 
     except Exception as e:
         error_msg = f"Error querying RAG system: {e}"
-        print(f"❌ {error_msg}")
+        log.error(f"❌ {error_msg}")
         return error_msg
 
 
-def query_rules(query: str, k: int = 3, verbose: bool = False, vectorstore: Optional[QdrantVectorstore] = None) -> str:
+def embed_queries(queries: List[str]) -> None:
+    """
+    Embed upcoming queries in one request and cache their vectors.
+
+    Later query_rag()/retrieve_chunks() calls for these queries skip the
+    per-query embedding call. Queries answered without retrieval (dice
+    shortcuts) or already cached are not sent.
+
+    Args:
+        queries: Queries that are about to be asked
+    """
+    missing = list(dict.fromkeys(
+        query for query in queries
+        if _shortcut_answer(query) is None and _get_query_vector(query) is None
+    ))
+    if not missing:
+        return
+
+    _, embedder, _ = _build_static_modules()
+    for query, vector in zip(missing, embedder.embed(missing)):
+        _put_query_vector(query, vector)
+
+
+def retrieve_chunks(
+    query: str,
+    collection_name: str,
+    k: int,
+    vectorstore: Optional[QdrantVectorstore] = None
+) -> list:
+    """
+    Retrieve the top-k chunks for a query without generating an answer.
+
+    Results are ordered best first with near-duplicates removed, so one
+    search at the largest k serves every smaller k by slicing (chunks[:k]
+    are the best k distinct chunks).
+
+    Args:
+        query: User's question
+        collection_name: Collection to search
+        k: Number of chunks to retrieve
+        vectorstore: Optional existing vectorstore
+
+    Returns:
+        list: Retrieved chunks
+    """
+    _, vectorstore = get_retrieval_pipeline(vectorstore)
+    return _search_chunks(vectorstore, collection_name, _embed_query(query), k)
+
+
+def _embed_query(query: str) -> List[float]:
+    """Query embedding, from the query-vector cache when possible"""
+    vector = _get_query_vector(query)
+    if vector is None:
+        _, embedder, _ = _build_static_modules()
+        vector = embedder.embed(query)
+        _put_query_vector(query, vector)
+    return vector
+
+
+def _search_chunks(vectorstore: QdrantVectorstore, collection_name: str, vector: List[float], k: int) -> list:
+    """
+    Top-k chunks for a query vector, with near-duplicates removed.
+
+    Same request as the batched async path: only the chunk text, plus the
+    stored vectors when k > 1 so duplicates can be detected.
+    """
+    response = vectorstore.get_client().query_points(
+        collection_name=collection_name,
+        query=vector,
+        using="embedding",
+        limit=k,
+        with_payload=_PROMPT_PAYLOAD,
+        with_vectors=["embedding"] if k > 1 else False,
+        search_params=search_params(k)
+    )
+    return vectorstore._point_to_chunk(_drop_duplicate_points(response.points))
+
+
+def answer_from_chunks(query: str, chunks: list) -> str:
+    """
+    Generate an answer from already retrieved chunks.
+
+    Args:
+        query: User's question
+        chunks: Chunks from retrieve_chunks() (or a slice of them)
+
+    Returns:
+        str: Generated answer
+    """
+    groq_client, _, prompt_template = _build_static_modules()
+    memory = prompt_template.format(chunks=chunks, user_prompt=query)
+    return groq_client.invoke(input=query, memory=memory).text
+
+
+def query_rules(
+    query: str,
+    k: int = 3,
+    verbose: bool = False,
+    vectorstore: Optional[QdrantVectorstore] = None,
+    synthesize: bool = True
+) -> str:
     """
     Query D&D rules collection.
 
@@ -207,14 +529,21 @@ def query_rules(query: str, k: int = 3, verbose: bool = False, vectorstore: Opti
         k: Number of chunks to retrieve
         verbose: Print debug info
         vectorstore: Optional existing vectorstore
+        synthesize: Generate an answer (False = retrieved chunk texts only)
 
     Returns:
         str: Answer based on D&D rules
     """
-    return query_rag(query, COLLECTION_RULES, k, verbose=verbose, vectorstore=vectorstore)
+    return query_rag(query, COLLECTION_RULES, k, verbose=verbose, vectorstore=vectorstore, synthesize=synthesize)
 
 
-def query_monsters(query: str, k: int = 1, verbose: bool = False, vectorstore: Optional[QdrantVectorstore] = None) -> str:
+def query_monsters(
+    query: str,
+    k: int = 1,
+    verbose: bool = False,
+    vectorstore: Optional[QdrantVectorstore] = None,
+    synthesize: bool = True
+) -> str:
     """
     Query monster stats collection (DM only).
 
@@ -223,14 +552,21 @@ def query_monsters(query: str, k: int = 1, verbose: bool = False, vectorstore: O
         k: Number of chunks to retrieve (default: 1 for specific lookups)
         verbose: Print debug info
         vectorstore: Optional existing vectorstore
+        synthesize: Generate an answer (False = retrieved chunk texts only)
 
     Returns:
         str: Monster information
     """
-    return query_rag(query, COLLECTION_MONSTERS, k, verbose=verbose, vectorstore=vectorstore)
+    return query_rag(query, COLLECTION_MONSTERS, k, verbose=verbose, vectorstore=vectorstore, synthesize=synthesize)
 
 
-def query_adventure(query: str, k: int = 5, verbose: bool = False, vectorstore: Optional[QdrantVectorstore] = None) -> str:
+def query_adventure(
+    query: str,
+    k: int = 5,
+    verbose: bool = False,
+    vectorstore: Optional[QdrantVectorstore] = None,
+    synthesize: bool = True
+) -> str:
     """
     Query adventure narrative collection (DM only).
 
@@ -239,54 +575,316 @@ def query_adventure(query: str, k: int = 5, verbose: bool = False, vectorstore:
         k: Number of chunks to retrieve (default: 5 for more context)
         verbose: Print debug info
         vectorstore: Optional existing vectorstore
+        synthesize: Generate an answer (False = retrieved chunk texts only)
 
     Returns:
         str: Adventure narrative information
     """
-    return query_rag(query, COLLECTION_ADVENTURE, k, verbose=verbose, vectorstore=vectorstore)
+    return query_rag(query, COLLECTION_ADVENTURE, k, verbose=verbose, vectorstore=vectorstore, synthesize=synthesize)
+
+
+# ============================================================================
+# Async Retrieval (micro-batched)
+# ============================================================================
+
+# Seconds to wait for more concurrent queries before dispatching a batch
+RAG_BATCH_WINDOW = 0.01
+
+
+class _RagBatcher:
+    """
+    Coalesce concurrent retrieval queries issued on one event loop.
+
+    Queries arriving within RAG_BATCH_WINDOW are embedded with a single
+    embeddings request (skipping texts already embedded) and searched with one Qdrant batch request per
+    (vectorstore, collection).
+    """
+
+    def __init__(self):
+        self._pending: List[tuple] = []  # (vectorstore, collection, query, k, future)
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def search(
+        self,
+        vectorstore: QdrantVectorstore,
+        collection_name: str,
+        query: str,
+        k: int
+    ) -> tuple[List[float], List[Chunk]]:
+        """Queue a query and wait for (query embedding, chunks)"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((vectorstore, collection_name, query, k, future))
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self):
+        """Dispatch everything queued during the window"""
+        await asyncio.sleep(RAG_BATCH_WINDOW)
+        batch, self._pending, self._flush_task = self._pending, [], None
+        error = None
+        try:
+            await self._dispatch(batch)
+        except Exception as e:
+            error = e  # Handed to the callers below instead of killing the task silently
+        finally:
+            # Never leave a caller waiting (unexpected error, missing response, cancellation)
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(error or RuntimeError("RAG batch ended without a result for this query"))
+
+    async def _dispatch(self, batch: List[tuple]):
+        """Embed and search one batch, resolving each query's future"""
+        try:
+            vectors_by_query = {}
+            for _, _, query, _, _ in batch:
+                if query not in vectors_by_query:
+                    vectors_by_query[query] = _get_query_vector(query)
+
+            missing = [query for query, vector in vectors_by_query.items() if vector is None]
+            if missing:
+                _, embedder, _ = _build_static_modules()
+                for query, vector in zip(missing, await embedder.a_embed(missing)):
+                    vectors_by_query[query] = vector
+                    _put_query_vector(query, vector)
+
+            vectors = [vectors_by_query[query] for _, _, query, _, _ in batch]
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # One Qdrant batch request per (vectorstore, collection)
+        groups: Dict[tuple, list] = {}
+        for item, vector in zip(batch, vectors):
+            groups.setdefault((id(item[0]), item[1]), []).append((item, vector))
+
+        for group in groups.values():
+            vectorstore, collection_name = group[0][0][0], group[0][0][1]
+            requests = [
+                models.QueryRequest(
+                    query=vector, using="embedding", limit=item[3], with_payload=_PROMPT_PAYLOAD,
+                    with_vector=["embedding"] if item[3] > 1 else False,  # For dedup
+                    params=search_params(item[3])
+                )
+                for item, vector in group
+            ]
+            try:
+                responses = await asyncio.to_thread(
+                    vectorstore.get_client().query_batch_points,
+                    collection_name=collection_name,
+                    requests=requests
+                )
+            except Exception as e:
+                for item, _ in group:
+                    if not item[4].done():
+                        item[4].set_exception(e)
+                continue
+
+            for (item, vector), response in zip(group, responses):
+                if item[4].done():
+                    continue
+                try:
+                    points = _drop_duplicate_points(response.points)
+                    item[4].set_result((vector, vectorstore._point_to_chunk(points)))
+                except Exception as e:
+                    item[4].set_exception(e)
+
+
+def _drop_duplicate_points(points: list, threshold: float = DUPLICATE_CHUNK_THRESHOLD) -> list:
+    """
+    Drop near-duplicate search results, keeping the best-ranked of each group.
+
+    Overlapping chunks (common in the adventure text) only add prompt tokens.
+    Points are scanned in rank order and skipped when their embedding's cosine
+    similarity to an already kept point exceeds the threshold.
+
+    Args:
+        points: Scored points in rank order, with the "embedding" vector
+        threshold: Cosine similarity above which a point counts as a duplicate
+
+    Returns:
+        Kept points, in rank order, with their vectors stripped
+    """
+    vectors = [
+        point.vector.get("embedding") if isinstance(point.vector, dict) else None
+        for point in points
+    ]
+    if len(points) < 2 or any(vector is None for vector in vectors):
+        return points
+
+    matrix = np.asarray(vectors, dtype=np.float32)
+    matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+    similarity = matrix @ matrix.T
+
+    kept = []
+    for i in range(len(points)):
+        if all(similarity[i, j] <= threshold for j in kept):
+            kept.append(i)
+
+    result = []
+    for i in kept:
+        points[i].vector = None  # Only needed for dedup
+        result.append(points[i])
+    return result
+
+
+# One batcher per event loop (futures can't cross loops)
+_batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _RagBatcher]" = weakref.WeakKeyDictionary()
+
+
+def _get_batcher() -> _RagBatcher:
+    """Get the batcher for the running event loop"""
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None:
+        batcher = _RagBatcher()
+        _batchers[loop] = batcher
+    return batcher
+
+
+async def a_query_rag(
+    query: str,
+    collection_name: str = COLLECTION_RULES,
+    k: int = 3,
+    verbose: bool = False,
+    vectorstore: Optional[QdrantVectorstore] = None,
+    synthesize: bool = True
+) -> str:
+    """
+    Async version of query_rag().
+
+    Retrieval is micro-batched with other concurrent queries; answer
+    generation runs per query on the shared Groq client. Answers are cached,
+    and near-duplicate queries reuse a cached answer.
+
+    Args:
+        query: User question or search query
+        collection_name: Which collection to search (rules/monsters/adventure)
+        k: Number of chunks to retrieve (default: 3)
+        verbose: Print debug information (default: False)
+        vectorstore: Optional existing vectorstore to reuse
+        synthesize: Generate an answer with the LLM (False = return the
+            retrieved chunk texts joined by blank lines, no LLM call)
+
+    Returns:
+        str: Generated answer based on retrieved context
+    """
+    shortcut = _shortcut_answer(query)
+    if shortcut is not None:
+        return shortcut
+
+    if _pipeline_ready(vectorstore):
+        _, vectorstore = get_retrieval_pipeline(vectorstore)
+    else:
+        # First query: build clients/vectorstore off the event loop
+        _, vectorstore = await asyncio.to_thread(get_retrieval_pipeline, vectorstore)
+    cache_scope = _cache_scope(collection_name, vectorstore)
+
+    cached = query_cache.get(cache_scope, k, query) if synthesize else None
+    if cached is not None:
+        query_cache.record(hit=True)
+        return cached
+    groq_client, _, prompt_template = _build_static_modules()
+
+    if verbose:
+        log.info(f"📝 Query: {query}")
+        log.info(f"📚 Collection: {collection_name}")
+        log.info(f"🔍 Retrieving top-{k} chunks\n")
+
+    try:
+        vector, chunks = await _get_batcher().search(vectorstore, collection_name, query, k)
+
+        if not synthesize:
+            return "\n\n".join(chunk.text for chunk in chunks)
+
+        # Near-duplicate of a cached query: skip generation
+        cached = query_cache.get_similar(cache_scope, k, vector)
+        if cached is not None:
+            query_cache.record(hit=True)
+            return cached
+
+        memory = prompt_template.format(chunks=chunks, user_prompt=query)
+        response = await groq_client.a_invoke(input=query, memory=memory)
+
+        answer = response.text
+        query_cache.record(hit=False)
+        query_cache.put(cache_scope, k, query, answer, vector)
+
+        if verbose:
+            log.info(f"✅ Answer generated ({len(answer)} characters)\n")
+
+        return answer
+
+    except Exception as e:
+        error_msg = f"Error querying RAG system: {e}"
+        log.error(f"❌ {error_msg}")
+        return error_msg
 
 
 # ============================================================================
 # Tool Wrappers for Agent Integration
 # ============================================================================
 
-@tool
-def query_rules_tool(query: str) -> str:
-    """Query D&D 5e rules knowledge base. Use this to look up game mechanics, spell descriptions, ability checks, combat rules, and other rulebook information."""
+async def _a_lookup(query: str, source: str) -> str:
+    """Answer a query from one knowledge source for the agent tools"""
+    collection_name, k, empty_message = _KNOWLEDGE_SOURCES[source]
     try:
-        result = query_rules(query, k=3, verbose=False)
+        result = await a_query_rag(query, collection_name, k=k)
         # Ensure result is never None or empty
         if not result or result.strip() == "":
-            return "No relevant information found in the rules database."
+            return empty_message
         return result
     except Exception as e:
-        return f"Error querying rules: {str(e)}"
+        return f"Error querying {source}: {str(e)}"
+
+
+# source -> (collection, k, message when nothing relevant is found)
+_KNOWLEDGE_SOURCES = {
+    "rules": (COLLECTION_RULES, 3, "No relevant information found in the rules database."),
+    "monsters": (COLLECTION_MONSTERS, 1, "No relevant monster information found."),
+    "adventure": (COLLECTION_ADVENTURE, 5, "No relevant adventure information found."),
+}
+
+
+@tool
+async def query_rules_tool(query: str) -> str:
+    """Query D&D 5e rules knowledge base. Use this to look up game mechanics, spell descriptions, ability checks, combat rules, and other rulebook information."""
+    return await _a_lookup(query, "rules")
 
 
 @tool
-def query_monsters_tool(query: str) -> str:
+async def query_monsters_tool(query: str) -> str:
     """Query monster stats and abilities knowledge base. Use this to look up monster stats, abilities, weaknesses, and combat tactics. DM use only."""
-    try:
-        result = query_monsters(query, k=1, verbose=False)
-        # Ensure result is never None or empty
-        if not result or result.strip() == "":
-            return "No relevant monster information found."
-        return result
-    except Exception as e:
-        return f"Error querying monsters: {str(e)}"
+    return await _a_lookup(query, "monsters")
 
 
 @tool
-def query_adventure_tool(query: str) -> str:
+async def query_adventure_tool(query: str) -> str:
     """Query adventure narrative and story knowledge base. Use this to retrieve plot points, NPC information, location descriptions, and quest details. DM use only."""
-    try:
-        result = query_adventure(query, k=5, verbose=False)
-        # Ensure result is never None or empty
-        if not result or result.strip() == "":
-            return "No relevant adventure information found."
-        return result
-    except Exception as e:
-        return f"Error querying adventure: {str(e)}"
+    return await _a_lookup(query, "adventure")
+
+
+@tool
+async def query_knowledge_tool(rules_query: str = "", monsters_query: str = "", adventure_query: str = "") -> str:
+    """Query several knowledge bases at once (rules, monsters, adventure). Use this instead of separate tool calls when a turn needs more than one lookup; leave unused queries empty. DM use only."""
+    queries = {
+        "rules": rules_query,
+        "monsters": monsters_query,
+        "adventure": adventure_query,
+    }
+    sources = [(source, query) for source, query in queries.items() if query.strip()]
+    if not sources:
+        return "No query provided."
+
+    # Lookups run concurrently; their retrievals share one embedding/search batch
+    results = await asyncio.gather(*(_a_lookup(query, source) for source, query in sources))
+    return "\n\n".join(
+        f"{source.capitalize()}:\n{result}"
+        for (source, _), result in zip(sources, results)
+    )
 
 
 if __name__ == "__main__":
@@ -11,9 +11,97 @@ Reference: docs/phases/PHASE_03_DICE.md
 
 import re
 import random
+from typing import Dict, List, Optional
+
+import numpy as np
 from datapizza.tools import tool
 
 
+# Rolls of at least this many dice are drawn in one vectorized NumPy call;
+# smaller rolls stay on the stdlib generator, which is cheaper per call
+VECTOR_ROLL_THRESHOLD = 16
+
+# Rolls of at least this many dice use one choices() call (C loop) instead of
+# a per-die randrange() comprehension
+CHOICES_ROLL_THRESHOLD = 4
+
+_rng = np.random.default_rng()
+
+# Dedicated stdlib generator for small rolls (independent of the global
+# random state); randrange(n) + 1 skips randint's argument handling
+_dice_rand = random.Random()
+_randrange = _dice_rand.randrange
+_choices = _dice_rand.choices
+
+# Pattern: (num)d(sides)(+/-modifier)? (advantage|disadvantage)?
+DICE_RE = re.compile(r'(\d+)d(\d+)([+-]\d+)?(?:\s+(advantage|disadvantage))?', re.ASCII)
+
+
+def _parse_notation(notation: str):
+    """
+    Parse dice notation into (num_dice, num_sides, modifier, adv_type).
+
+    Plain "NdM" rolls are split by hand; everything else goes through the
+    compiled regex. Returns None for invalid notation.
+    """
+    if notation.isascii():
+        num, sep, sides = notation.partition('d')
+        if sep and num.isdigit() and sides.isdigit():
+            return int(num), int(sides), 0, None
+
+    match = DICE_RE.match(notation.lower().strip())
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2)), int(match.group(3) or 0), match.group(4)
+
+
+def _roll(num_dice: int, num_sides: int, times: int = 1) -> tuple:
+    """
+    Roll num_dice dice `times` times.
+
+    Returns:
+        (rolls, sums): one list of ints per roll, and each roll's total
+    """
+    if num_dice * times >= VECTOR_ROLL_THRESHOLD:
+        rolls = _rng.integers(1, num_sides + 1, size=(times, num_dice))
+        return rolls.tolist(), rolls.sum(axis=1).tolist()
+    if num_dice >= CHOICES_ROLL_THRESHOLD:
+        faces = range(1, num_sides + 1)
+        rolls = [_choices(faces, k=num_dice) for _ in range(times)]
+    else:
+        rolls = [[_randrange(num_sides) + 1 for _ in range(num_dice)] for _ in range(times)]
+    return rolls, [sum(roll) for roll in rolls]
+
+
+def _validation_error(num_dice: int, num_sides: int):
+    """Error message for out-of-range dice, or None if valid"""
+    if num_dice < 1 or num_dice > 100:
+        return f"Invalid number of dice: {num_dice} (must be 1-100)"
+    if num_sides < 2 or num_sides > 1000:
+        return f"Invalid die size: d{num_sides} (must be d2-d1000)"
+    return None
+
+
+def _roll_total(num_dice: int, num_sides: int, modifier: int = 0, adv_type=None) -> int:
+    """Roll and return only the total (no per-die lists or formatting)"""
+    times = 2 if adv_type else 1
+    if num_dice * times >= VECTOR_ROLL_THRESHOLD:
+        sums = _rng.integers(1, num_sides + 1, size=(times, num_dice)).sum(axis=1).tolist()
+    elif num_dice >= CHOICES_ROLL_THRESHOLD:
+        faces = range(1, num_sides + 1)
+        sums = [sum(_choices(faces, k=num_dice)) for _ in range(times)]
+    else:
+        sums = [sum(_randrange(num_sides) for _ in range(num_dice)) + num_dice for _ in range(times)]
+
+    if adv_type == 'advantage':
+        subtotal = max(sums)
+    elif adv_type == 'disadvantage':
+        subtotal = min(sums)
+    else:
+        subtotal = sums[0]
+    return subtotal + modifier
+
+
 @tool
 def roll_dice(notation: str) -> str:
     """
@@ -36,51 +124,152 @@ def roll_dice(notation: str) -> str:
         >>> roll_dice("1d20 advantage")
         "1d20 advantage: rolled [12] and [18], kept [18] = 18"
     """
-    # Parse notation with regex
-    # Pattern: (num)d(sides)(+/-modifier)? (advantage|disadvantage)?
-    pattern = r'(\d+)d(\d+)([+-]\d+)?(\s+(advantage|disadvantage))?'
-    match = re.match(pattern, notation.lower().strip())
-
-    if not match:
+    parsed = _parse_notation(notation)
+    if parsed is None:
         return f"Invalid notation: {notation}"
 
-    # Extract components
-    num_dice = int(match.group(1))
-    num_sides = int(match.group(2))
-    modifier = int(match.group(3) or 0)
-    adv_type = match.group(5)  # 'advantage' or 'disadvantage' or None
+    # adv_type is 'advantage', 'disadvantage' or None
+    num_dice, num_sides, modifier, adv_type = parsed
 
     # Validation
-    if num_dice < 1 or num_dice > 100:
-        return f"Invalid number of dice: {num_dice} (must be 1-100)"
-    if num_sides < 2 or num_sides > 1000:
-        return f"Invalid die size: d{num_sides} (must be d2-d1000)"
+    error = _validation_error(num_dice, num_sides)
+    if error:
+        return error
+
+    # Roll dice (twice for advantage/disadvantage)
+    rolls, sums = _roll(num_dice, num_sides, times=2 if adv_type else 1)
+    return _format_roll(notation, modifier, adv_type, rolls, sums)
 
-    # Roll dice
+
+def _format_roll(notation: str, modifier: int, adv_type, rolls: list, sums: list) -> str:
+    """Format one roll_dice() result from its drawn rolls and their sums"""
     if adv_type:
-        # Roll twice for advantage/disadvantage
-        rolls1 = [random.randint(1, num_sides) for _ in range(num_dice)]
-        rolls2 = [random.randint(1, num_sides) for _ in range(num_dice)]
+        # Ties keep the second roll
+        (rolls1, rolls2), (sum1, sum2) = rolls, sums
 
         if adv_type == 'advantage':
-            rolls = rolls1 if sum(rolls1) > sum(rolls2) else rolls2
-            result_text = f"rolled {rolls1} and {rolls2}, kept {rolls}"
+            keep_first = sum1 > sum2
         else:  # disadvantage
-            rolls = rolls1 if sum(rolls1) < sum(rolls2) else rolls2
-            result_text = f"rolled {rolls1} and {rolls2}, kept {rolls}"
+            keep_first = sum1 < sum2
+        kept, subtotal = (rolls1, sum1) if keep_first else (rolls2, sum2)
+        result_text = f"rolled {rolls1} and {rolls2}, kept {kept}"
     else:
         # Normal roll
-        rolls = [random.randint(1, num_sides) for _ in range(num_dice)]
-        result_text = str(rolls)
+        (kept,), (subtotal,) = rolls, sums
+        result_text = str(kept)
 
     # Calculate total
-    total = sum(rolls) + modifier
+    total = subtotal + modifier
 
     # Format output
     modifier_text = f" {modifier:+d}" if modifier != 0 else ""
     return f"{notation}: {result_text}{modifier_text} = {total}"
 
 
+def roll_dice_many(notations: List[str]) -> List[str]:
+    """
+    Roll several notations at once (e.g. an attack and its damage).
+
+    Notations sharing the same dice are drawn together in one NumPy call.
+    Each result is formatted exactly like roll_dice(), including the error
+    messages for invalid notation.
+
+    Args:
+        notations: Dice notations, e.g. ["1d20+5 advantage", "2d6+3"]
+
+    Returns:
+        List of formatted results, in input order
+    """
+    results: List[Optional[str]] = [None] * len(notations)
+    groups: Dict[tuple, List[tuple]] = {}  # (dice, sides, times) -> [(index, modifier, adv_type)]
+
+    for i, notation in enumerate(notations):
+        parsed = _parse_notation(notation)
+        if parsed is None:
+            results[i] = f"Invalid notation: {notation}"
+            continue
+
+        num_dice, num_sides, modifier, adv_type = parsed
+        error = _validation_error(num_dice, num_sides)
+        if error:
+            results[i] = error
+            continue
+
+        key = (num_dice, num_sides, 2 if adv_type else 1)
+        groups.setdefault(key, []).append((i, modifier, adv_type))
+
+    for (num_dice, num_sides, times), members in groups.items():
+        draws = _rng.integers(1, num_sides + 1, size=(len(members), times, num_dice))
+        all_sums = draws.sum(axis=2).tolist()
+        for (i, modifier, adv_type), rolls, sums in zip(members, draws.tolist(), all_sums):
+            results[i] = _format_roll(notations[i], modifier, adv_type, rolls, sums)
+
+    return results
+
+
+def roll_total(notation: str) -> int:
+    """
+    Roll dice and return just the total.
+
+    Same notation as roll_dice(), for code that only needs the number
+    (e.g. automated initiative or monster attacks).
+
+    Args:
+        notation: Dice notation, e.g. "1d20+3" or "1d20 advantage"
+
+    Returns:
+        int: Total including modifier
+
+    Raises:
+        ValueError: If the notation is invalid or out of range
+    """
+    parsed = _parse_notation(notation)
+    if parsed is None:
+        raise ValueError(f"Invalid notation: {notation}")
+
+    num_dice, num_sides, modifier, adv_type = parsed
+    error = _validation_error(num_dice, num_sides)
+    if error:
+        raise ValueError(error)
+
+    return _roll_total(num_dice, num_sides, modifier, adv_type)
+
+
+def roll_dice_batch(notation: str, n: int) -> np.ndarray:
+    """
+    Roll the same dice notation n times in one vectorized draw.
+
+    Args:
+        notation: Dice notation, e.g. "1d20+5" or "1d20 advantage"
+        n: Number of independent rolls
+
+    Returns:
+        np.ndarray: n totals (modifier included)
+
+    Raises:
+        ValueError: If the notation is invalid or out of range
+    """
+    parsed = _parse_notation(notation)
+    if parsed is None:
+        raise ValueError(f"Invalid notation: {notation}")
+
+    num_dice, num_sides, modifier, adv_type = parsed
+    error = _validation_error(num_dice, num_sides)
+    if error:
+        raise ValueError(error)
+
+    times = 2 if adv_type else 1
+    sums = _rng.integers(1, num_sides + 1, size=(n, times, num_dice)).sum(axis=2)
+
+    if adv_type == 'advantage':
+        totals = sums.max(axis=1)
+    elif adv_type == 'disadvantage':
+        totals = sums.min(axis=1)
+    else:
+        totals = sums[:, 0]
+    return totals + modifier
+
+
 def set_dice_seed(seed: int):
     """
     Set random seed for reproducible dice rolls.
@@ -89,7 +278,9 @@ def set_dice_seed(seed: int):
     Args:
         seed: Integer seed for random number generator
     """
-    random.seed(seed)
+    global _rng
+    _dice_rand.seed(seed)
+    _rng = np.random.default_rng(seed)
 
 
 # Example usage (not executed when imported as module)
@@ -2,7 +2,12 @@
 Server startup script for D&D Multi-Agent Game
 
 Usage:
-    python src/ui/run_server.py
+    python src/ui/run_server.py                  # Development (auto-reload)
+    DND_ENV=production python src/ui/run_server.py
+
+Production runs disable the reloader and use uvloop/httptools when they are
+installed (pip install uvloop httptools); otherwise uvicorn falls back to the
+asyncio loop and h11.
 
 Server will start on:
     http://localhost:8000 (Web interface)
@@ -11,6 +16,7 @@ Server will start on:
 
 import uvicorn
 from dotenv import load_dotenv
+import os
 import sys
 from pathlib import Path
 
@@ -22,18 +28,34 @@ if __name__ == "__main__":
     # Load environment variables
     load_dotenv()
 
+    production = os.getenv("DND_ENV", "development").lower() in ("prod", "production")
+
     print("=" * 50)
     print("D&D Multi-Agent Game Server")
     print("=" * 50)
+    print(f"Mode: {'production' if production else 'development (auto-reload)'}")
     print("Starting server on http://localhost:8000")
     print("WebSocket endpoint: ws://localhost:8000/ws")
     print("Press Ctrl+C to stop")
     print("=" * 50)
 
-    uvicorn.run(
-        "src.ui.server:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,  # Auto-reload during development
-        log_level="info"
-    )
+    if production:
+        uvicorn.run(
+            "src.ui.server:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=False,
+            workers=1,           # Game state lives in this process
+            loop="auto",         # uvloop if installed
+            http="auto",         # httptools if installed
+            ws="websockets",
+            log_level="info"
+        )
+    else:
+        uvicorn.run(
+            "src.ui.server:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,  # Auto-reload during development
+            log_level="info"
+        )
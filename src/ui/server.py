@@ -14,12 +14,18 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
-from typing import List
+from contextlib import asynccontextmanager
+from typing import Set
 import asyncio
 import json
 import os
 from pathlib import Path
 
+from src.game_log import get_logger
+
+
+log = get_logger("server")
+
 
 # ==================== ConnectionManager ====================
 
@@ -34,18 +40,18 @@ class ConnectionManager:
     """
 
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         """Accept new WebSocket connection"""
         await websocket.accept()
-        self.active_connections.append(websocket)
-        print(f"✅ Client connected. Total connections: {len(self.active_connections)}")
+        self.active_connections.add(websocket)
+        log.info(f"✅ Client connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
         """Remove disconnected WebSocket"""
-        self.active_connections.remove(websocket)
-        print(f"❌ Client disconnected. Total connections: {len(self.active_connections)}")
+        self.active_connections.discard(websocket)  # May already be dropped by broadcast
+        log.info(f"❌ Client disconnected. Total connections: {len(self.active_connections)}")
 
     async def broadcast(self, message: dict):
         """
@@ -54,19 +60,56 @@ class ConnectionManager:
         Args:
             message: Dictionary to send as JSON
         """
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                print(f"Error broadcasting to client: {e}")
+        # Encode once for all clients instead of once per connection
+        await self.broadcast_text(json.dumps(message))
+
+    async def broadcast_text(self, data: str):
+        """
+        Broadcast an already-encoded JSON text frame to all connected clients.
+
+        Sends run concurrently, so one slow spectator does not delay the rest.
+        Connections whose send fails are dropped.
+
+        Args:
+            data: JSON string to send
+        """
+        connections = tuple(self.active_connections)  # Snapshot: sockets may disconnect mid-send
+        results = await asyncio.gather(
+            *(connection.send_text(data) for connection in connections),
+            return_exceptions=True
+        )
+
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                log.warning(f"Error broadcasting to client: {result}")
+                self.active_connections.discard(connection)
 
 
 # ==================== FastAPI Application ====================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Server startup/shutdown.
+
+    Startup builds the RAG pipeline in the background so the first turn
+    doesn't pay for it; shutdown closes the pooled async LLM connections
+    opened on the server loop.
+    """
+    global warmup_task
+    from src.http_pool import close_async_pools
+    from src.rag.retrieval import warm_up_retrieval
+
+    warmup_task = asyncio.create_task(asyncio.to_thread(warm_up_retrieval))
+    yield
+    await close_async_pools()
+
+
 app = FastAPI(
     title="D&D Multi-Agent Game",
     description="Real-time spectator interface for AI-powered D&D",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware (allow all origins for development)
@@ -84,6 +127,7 @@ manager = ConnectionManager()
 # Game state
 orchestrator = None
 game_task = None
+warmup_task = None
 
 
 # ==================== Game Control Functions ====================
@@ -104,9 +148,9 @@ async def start_game():
         # Import here to avoid circular dependencies
         from src.orchestration.orchestrator import GameOrchestrator
         from src.agents.dm_agent import create_dm_agent
+        from src.agents import load_character
         from src.agents.player_agent import create_player_agent
         from src.memory.hybrid_memory import HybridMemorySystem
-        import yaml
 
         # Verify required API keys are set
         if not os.getenv("OPENAI_API_KEY"):
@@ -132,8 +176,7 @@ async def start_game():
         players = []
 
         for char_file in character_files:
-            with open(char_file, "r") as f:
-                character = yaml.safe_load(f)
+            character = load_character(char_file.name, str(characters_dir))
             # Use OpenAI for players (best tool calling support)
             players.append(create_player_agent(character, provider="openai"))
 
@@ -163,13 +206,9 @@ async def broadcast_message(message):
     Args:
         message: Message from game
     """
-    await manager.broadcast({
-        "type": "game_message",
-        "speaker": message.speaker,
-        "text": message.text,
-        "timestamp": message.timestamp,
-        "metadata": message.metadata if hasattr(message, 'metadata') else {}
-    })
+    # Reuse the message's cached JSON and prepend the frame type:
+    # '{"speaker": ...}' -> '{"type": "game_message", "speaker": ...}'
+    await manager.broadcast_text('{"type": "game_message", ' + message.to_json()[1:])
 
 
 def pause_game():
@@ -256,7 +295,7 @@ async def handle_command(data: dict):
     elif command == "reset_game":
         reset_game()
     else:
-        print(f"Unknown command: {command}")
+        log.warning(f"Unknown command: {command}")
 
 
 # ==================== HTTP Endpoints ====================
@@ -264,10 +303,13 @@ async def handle_command(data: dict):
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
+    from src.rag.cache import query_cache
+
     return {
         "status": "healthy",
         "connections": len(manager.active_connections),
-        "game_active": orchestrator.game_active if orchestrator else False
+        "game_active": orchestrator.game_active if orchestrator else False,
+        "rag_cache": query_cache.stats()
     }
 
 
@@ -0,0 +1,207 @@
+"""
+Response cache for live-LLM agent tests
+
+The agent tests send fixed prompts, so re-running the suite repeats the same
+network calls. cache_agent() wraps an agent's run()/a_run() so responses are
+stored in tests/.llm_cache.json and replayed on later runs.
+
+Keys are exact (agent name, prompt) pairs: the test prompts are literal
+strings, so an embedding-based lookup would add a network call per prompt
+without producing more hits.
+
+Agents that carry conversation memory (the orchestrator and playthrough tests)
+send different context with the same prompt, so cache_client() caches one
+level lower instead: each model call is keyed by a SHA-256 over the model,
+system prompt, temperature, tools, input and memory. Only plain-text replies
+are stored; tool-call steps always reach the model so the tools really run.
+
+Set DISABLE_LLM_CACHE=1 to always call the model (fresh CI runs).
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from datapizza.core.clients.models import ClientResponse, TokenUsage
+from datapizza.type import TextBlock
+
+
+CACHE_PATH = Path(__file__).parent / ".llm_cache.json"
+
+_lock = threading.Lock()
+_entries = None
+
+# Lookups served from / missed by the cache in this process
+stats = {"hits": 0, "misses": 0}
+
+
+class CachedResponse:
+    """Stand-in for an agent result replayed from the cache"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+def cache_enabled() -> bool:
+    """Whether responses are cached (DISABLE_LLM_CACHE unset)"""
+    return os.getenv("DISABLE_LLM_CACHE", "") not in ("1", "true", "yes")
+
+
+def _load() -> dict:
+    """Load cache entries from disk (once)"""
+    global _entries
+    if _entries is None:
+        try:
+            _entries = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _entries = {}
+    return _entries
+
+
+def _key(agent_name: str, prompt: str) -> str:
+    return hashlib.sha256(f"{agent_name}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def _get_text(key: str):
+    with _lock:
+        text = _load().get(key)
+        stats["hits" if text is not None else "misses"] += 1
+    return text
+
+
+def _put_text(key: str, text) -> None:
+    if not text:
+        return  # Don't replay empty/failed responses
+    with _lock:
+        entries = _load()
+        entries[key] = text
+        CACHE_PATH.write_text(json.dumps(entries, indent=1), encoding="utf-8")
+
+
+def _get(agent_name: str, prompt: str):
+    text = _get_text(_key(agent_name, prompt))
+    return CachedResponse(text) if text is not None else None
+
+
+def _put(agent_name: str, prompt: str, response) -> None:
+    _put_text(_key(agent_name, prompt), getattr(response, "text", None))
+
+
+def _without_ids(value):
+    """Drop provider-generated call ids, which differ on every run"""
+    if isinstance(value, dict):
+        return {k: _without_ids(v) for k, v in value.items() if k != "id"}
+    if isinstance(value, list):
+        return [_without_ids(v) for v in value]
+    return value
+
+
+def _client_key(client, kwargs: dict) -> str:
+    """Content hash of one model call"""
+    payload = {
+        "model": client.model_name,
+        "system_prompt": kwargs.get("system_prompt"),
+        "temperature": kwargs.get("temperature"),
+        "max_tokens": kwargs.get("max_tokens"),
+        "tool_choice": kwargs.get("tool_choice"),
+        "tools": sorted(tool.name for tool in kwargs.get("tools") or []),
+        "input": [block.to_dict() for block in kwargs.get("input") or []],
+        "memory": kwargs["memory"].to_dict() if kwargs.get("memory") else [],
+    }
+    encoded = json.dumps(_without_ids(payload), sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _text_only(response) -> bool:
+    """Whether a response is plain text (no tool calls to execute)"""
+    return bool(response.content) and all(isinstance(block, TextBlock) for block in response.content)
+
+
+def cache_agent(agent):
+    """
+    Wrap an agent's run()/a_run() with the response cache.
+
+    Args:
+        agent: datapizza Agent
+
+    Returns:
+        The same agent (unchanged if the cache is disabled)
+    """
+    if not cache_enabled():
+        return agent
+
+    run, a_run = agent.run, agent.a_run
+
+    def cached_run(task_input, *args, **kwargs):
+        cached = _get(agent.name, task_input)
+        if cached is not None:
+            return cached
+        response = run(task_input, *args, **kwargs)
+        _put(agent.name, task_input, response)
+        return response
+
+    async def cached_a_run(task_input, *args, **kwargs):
+        cached = _get(agent.name, task_input)
+        if cached is not None:
+            return cached
+        response = await a_run(task_input, *args, **kwargs)
+        _put(agent.name, task_input, response)
+        return response
+
+    agent.run = cached_run
+    agent.a_run = cached_a_run
+    return agent
+
+
+def cache_client(client):
+    """
+    Cache a datapizza client's model calls by request content.
+
+    Wraps the client's _invoke()/_a_invoke(), so every agent (or bound copy)
+    using this client goes through the cache.
+
+    Args:
+        client: datapizza client
+
+    Returns:
+        The same client (unchanged if the cache is disabled)
+    """
+    # Lazy proxies (player agents) forward calls to the real client: wrap that one
+    if hasattr(client, "_factory"):
+        client.model_name  # Builds the inner client
+        client = client._inner
+
+    if not cache_enabled() or getattr(client, "_llm_cached", False):
+        return client  # Disabled, or already wrapped (clients can be shared)
+
+    invoke, a_invoke = client._invoke, client._a_invoke
+
+    def replay(text):
+        return ClientResponse(content=[TextBlock(content=text)], stop_reason="cached", usage=TokenUsage())
+
+    def cached_invoke(**kwargs):
+        key = _client_key(client, kwargs)
+        text = _get_text(key)
+        if text is not None:
+            return replay(text)
+        response = invoke(**kwargs)
+        if _text_only(response):
+            _put_text(key, response.text)
+        return response
+
+    async def cached_a_invoke(**kwargs):
+        key = _client_key(client, kwargs)
+        text = _get_text(key)
+        if text is not None:
+            return replay(text)
+        response = await a_invoke(**kwargs)
+        if _text_only(response):
+            _put_text(key, response.text)
+        return response
+
+    client._invoke = cached_invoke
+    client._a_invoke = cached_a_invoke
+    client._llm_cached = True
+    return client
@@ -9,16 +9,132 @@ Tests for Phase 4: Agent Implementation
 - All agents together
 """
 
+import asyncio
+import io
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from datapizza.agents.agent import StepResult
 from datapizza.memory import Memory
 from datapizza.type import ROLE, TextBlock
 
-from src.agents import create_game_agents, load_all_characters
+from src.agents import create_game_agents, create_party, load_all_characters
+from src.agents.dm_agent import create_dm_agent
+from tests._llm_cache import cache_agent, cache_enabled
+
+
+# Agents are stateless, so tests share one instance of each instead of
+# rebuilding clients and tool lists per test. Responses are replayed from
+# tests/.llm_cache.json (see _llm_cache.py; DISABLE_LLM_CACHE=1 to bypass)
+@lru_cache(maxsize=None)
+def shared_dm_agent():
+    """DM agent shared by all tests"""
+    return cache_agent(create_dm_agent(stream=True))
+
+
+@lru_cache(maxsize=None)
+def shared_groq_party():
+    """Single-player Groq party shared by all tests"""
+    return [cache_agent(player) for player in create_party(providers=["groq"])]
+
+
+def run_until(agent, prompt: str, done) -> str:
+    """
+    Get an agent's reply, stopping generation as soon as done(text) holds.
+
+    With the response cache on, the full reply is fetched once and replayed.
+    Uncached runs stream text deltas instead; leaving the stream early closes
+    the HTTP response, so the provider stops generating (and billing) tokens.
+    """
+    if cache_enabled():
+        return agent.run(prompt).text
+
+    text = ""
+    stream = agent.stream_invoke(prompt)
+    try:
+        for step in stream:
+            delta = getattr(step, "delta", None)
+            if delta:
+                text += delta
+                if done(text):
+                    break
+            elif isinstance(step, StepResult):
+                text = step.text or text
+    finally:
+        stream.close()
+    return text
+
+
+# Validation keywords for the DM tests (streams stop once one appears)
+RULE_KEYWORDS = ('grapple', 'athletics', 'contested', 'check', 'escape')
+DICE_KEYWORDS = ('roll', 'd20', 'dice', 'hit', 'miss')
+
+
+def _mentions_any(keywords):
+    """Predicate: text mentions any of the keywords (case-insensitive)"""
+    return lambda text: any(keyword in text.lower() for keyword in keywords)
+
+
+# Tests are independent, so run_all_tests() runs them concurrently; this caps
+# in-flight tests to stay under provider rate limits
+MAX_CONCURRENT_TESTS = 3
+
+
+class _ThreadOutput(io.TextIOBase):
+    """stdout proxy that buffers writes per thread, so concurrent tests don't interleave"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+async def _run_test(test_name, test_func, output, limit):
+    """Run one test in a worker thread; returns (name, result, captured output)"""
+
+    def run():
+        output.local.buffer = buffer = io.StringIO()
+        try:
+            result = test_func()
+        except Exception as e:
+            print(f"\n❌ TEST CRASHED: {test_name}")
+            print(f"   Error: {e}\n")
+            result = False
+        finally:
+            output.local.buffer = None
+        return result, buffer.getvalue()
+
+    async with limit:
+        result, captured = await asyncio.to_thread(run)
+    return test_name, result, captured
+
+
+async def _run_tests_concurrently(tests):
+    """Run tests concurrently, printing each test's output in suite order"""
+    limit = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        runs = await asyncio.gather(
+            *(_run_test(name, func, output, limit) for name, func in tests)
+        )
+    finally:
+        sys.stdout = output.stream
+
+    for _, _, captured in runs:
+        print(captured, end="")
+    return [(name, result) for name, result, _ in runs]
 
 
 def print_section(title: str):
@@ -28,13 +144,27 @@ def print_section(title: str):
     print("=" * 70 + "\n")
 
 
+def test_character_loading_cache():
+    """Test 0: Character Loading - Cached Parse Returns Independent Copies"""
+    print_section("TEST 0: Character Loading Cache")
+
+    from src.agents import load_character
+
+    first = load_character("character1.yaml")
+    first["name"] = "Mutated"
+    second = load_character("character1.yaml")
+
+    assert second["name"] != "Mutated", "Cached sheet was mutated by caller"
+    print(f"✅ Cached load returned fresh copy: {second['name']}")
+
+    return True
+
+
 def test_dm_basic_narration():
     """Test 1: DM Agent - Basic Narration"""
     print_section("TEST 1: DM Agent - Basic Narration")
 
-    from src.agents.dm_agent import create_dm_agent
-
-    dm = create_dm_agent()
+    dm = shared_dm_agent()
 
     print("✅ DM agent created")
     print(f"   Name: {dm.name}")
@@ -44,11 +174,14 @@ def test_dm_basic_narration():
     print("Prompt: 'Start the adventure. Describe the opening scene.'\n")
 
     try:
-        response = dm.run("Start the adventure. Describe the opening scene.")
-        print(f"DM: {response.text}\n")
+        text = run_until(
+            dm, "Start the adventure. Describe the opening scene.",
+            lambda text: len(text) > 50
+        )
+        print(f"DM: {text}\n")
 
         # Validation
-        assert len(response.text) > 50, "Response too short"
+        assert len(text) > 50, "Response too short"
         print("✅ TEST PASSED: DM provided substantial narration")
 
     except Exception as e:
@@ -62,20 +195,20 @@ def test_dm_rule_query():
     """Test 2: DM Agent - Rule Query (RAG Integration)"""
     print_section("TEST 2: DM Agent - Rule Query (RAG)")
 
-    from src.agents.dm_agent import create_dm_agent
-
-    dm = create_dm_agent()
+    dm = shared_dm_agent()
 
     print("🎲 Testing RAG integration...")
     print("Prompt: 'A player wants to grapple an enemy. What are the rules?'\n")
 
     try:
-        response = dm.run("A player wants to grapple an enemy. What are the rules?")
-        print(f"DM: {response.text}\n")
+        text = run_until(
+            dm, "A player wants to grapple an enemy. What are the rules?",
+            _mentions_any(RULE_KEYWORDS)
+        )
+        print(f"DM: {text}\n")
 
         # Validation (check for rule-related keywords)
-        text_lower = response.text.lower()
-        has_rule_info = any(keyword in text_lower for keyword in ['grapple', 'athletics', 'contested', 'check', 'escape'])
+        has_rule_info = _mentions_any(RULE_KEYWORDS)(text)
 
         if has_rule_info:
             print("✅ TEST PASSED: DM retrieved and explained rules")
@@ -93,20 +226,20 @@ def test_dm_dice_rolling():
     """Test 3: DM Agent - Dice Rolling"""
     print_section("TEST 3: DM Agent - Dice Rolling")
 
-    from src.agents.dm_agent import create_dm_agent
-
-    dm = create_dm_agent()
+    dm = shared_dm_agent()
 
     print("🎲 Testing dice tool usage...")
     print("Prompt: 'A goblin attacks the party with a shortbow. Roll to hit (AC 15).'\n")
 
     try:
-        response = dm.run("A goblin attacks the party with a shortbow. Roll to hit (AC 15).")
-        print(f"DM: {response.text}\n")
+        text = run_until(
+            dm, "A goblin attacks the party with a shortbow. Roll to hit (AC 15).",
+            _mentions_any(DICE_KEYWORDS)
+        )
+        print(f"DM: {text}\n")
 
         # Validation (check for dice-related content)
-        text_lower = response.text.lower()
-        has_dice = any(keyword in text_lower for keyword in ['roll', 'd20', 'dice', 'hit', 'miss'])
+        has_dice = _mentions_any(DICE_KEYWORDS)(text)
 
         if has_dice:
             print("✅ TEST PASSED: DM used dice rolling")
@@ -124,9 +257,7 @@ def test_player_action_declaration():
     """Test 4: Player Agent - Action Declaration"""
     print_section("TEST 4: Player Agent - Action Declaration")
 
-    from src.agents import create_party
-
-    party = create_party(providers=["groq"])  # Use just Groq for speed
+    party = shared_groq_party()  # Use just Groq for speed
     player1 = party[0]
 
     print(f"✅ Player agent created: {player1.name}")
@@ -155,9 +286,7 @@ def test_player_character_consistency():
     """Test 5: Player Agent - Character Consistency"""
     print_section("TEST 5: Player Agent - Character Consistency")
 
-    from src.agents import create_party
-
-    party = create_party(providers=["groq"])  # Use Groq only for consistency
+    party = shared_groq_party()  # Use Groq only for consistency
     player1 = party[0]
 
     print(f"✅ Testing character consistency for: {player1.name}")
@@ -187,11 +316,8 @@ def test_multi_turn_conversation():
     """Test 6: Multi-Turn Conversation (DM + Player)"""
     print_section("TEST 6: Multi-Turn Conversation")
 
-    from src.agents.dm_agent import create_dm_agent
-    from src.agents import create_party
-
-    dm = create_dm_agent()
-    party = create_party(providers=["groq"])
+    dm = shared_dm_agent()
+    party = shared_groq_party()
     player1 = party[0]
 
     memory = Memory()
@@ -234,6 +360,8 @@ def test_all_agents_together():
 
     try:
         dm, players = create_game_agents(player_providers=["groq", "groq", "groq"])
+        dm = cache_agent(dm)
+        players = [cache_agent(player) for player in players]
 
         print("✅ Game agents created:")
         print(f"   DM: {dm.name}")
@@ -246,10 +374,16 @@ def test_all_agents_together():
         print(f"[DM]: {dm_msg.text}\n")
         print("-" * 70 + "\n")
 
-        # Each player responds
-        for i, player in enumerate(players, 1):
+        # Players respond concurrently (independent LLM calls)
+        async def respond_all():
+            return await asyncio.gather(*(
+                player.a_run(f"DM says: {dm_msg.text}") for player in players
+            ))
+
+        player_msgs = asyncio.run(respond_all())
+
+        for i, (player, player_msg) in enumerate(zip(players, player_msgs), 1):
             print(f"🎲 Player {i} responds\n")
-            player_msg = player.run(f"DM says: {dm_msg.text}")
             print(f"[{player.name}]: {player_msg.text}\n")
             print("-" * 70 + "\n")
 
@@ -269,6 +403,7 @@ def run_all_tests():
     print("=" * 70)
 
     tests = [
+        ("Character Loading Cache", test_character_loading_cache),
         ("DM Basic Narration", test_dm_basic_narration),
         ("DM Rule Query (RAG)", test_dm_rule_query),
         ("DM Dice Rolling", test_dm_dice_rolling),
@@ -278,16 +413,7 @@ def run_all_tests():
         ("All Agents Together", test_all_agents_together),
     ]
 
-    results = []
-
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"\n❌ TEST CRASHED: {test_name}")
-            print(f"   Error: {e}\n")
-            results.append((test_name, False))
+    results = asyncio.run(_run_tests_concurrently(tests))
 
     # Print summary
     print_section("TEST SUMMARY")
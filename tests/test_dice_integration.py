@@ -9,14 +9,31 @@ Reference: docs/phases/PHASE_03_DICE.md (Integration Preparation section)
 """
 
 import os
+from functools import lru_cache
+
+import pytest
 from dotenv import load_dotenv
 from datapizza.clients.openai import OpenAIClient
 from datapizza.agents import Agent
+from src.http_pool import share_connection_pool
 from src.tools.dice import roll_dice
 
 # Load environment variables
 load_dotenv()
 
+# Network tests are reported as skipped under pytest when no key is set
+# (the in-body checks still cover direct script runs)
+requires_openai = pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OPENAI_API_KEY not set")
+
+
+@lru_cache(maxsize=None)
+def shared_openai_client() -> OpenAIClient:
+    """One pooled client shared by the network tests"""
+    return share_connection_pool(OpenAIClient(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        model="gpt-4o-mini"
+    ))
+
 
 def test_tool_metadata():
     """Test that @tool decorator properly sets metadata"""
@@ -41,76 +58,60 @@ def test_direct_tool_call():
     print()
 
 
-def test_client_tool_invocation():
-    """Test tool invocation via OpenAI client"""
-    print("=== Test Client Tool Invocation ===")
+def _invoke_via_client(client):
+    """Tool call through the raw client API"""
+    return client.invoke(
+        "Roll 1d20+5 for me",
+        tools=[roll_dice],
+        tool_choice="auto"
+    )
 
-    # Get API key from environment
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        print("⚠️  OPENAI_API_KEY not found, skipping client test")
-        return
 
-    try:
-        # Create client
-        client = OpenAIClient(
-            api_key=api_key,
-            model="gpt-4o-mini"
-        )
+def _invoke_via_agent(client):
+    """Tool call through an Agent wrapping the client"""
+    agent = Agent(
+        name="dice_roller",
+        client=client,
+        tools=[roll_dice],
+        system_prompt="You are a D&D dice rolling assistant. When asked to roll dice, use the roll_dice tool."
+    )
+    return agent.run("Roll initiative for a goblin (+2 bonus)")
 
-        # Test tool invocation
-        response = client.invoke(
-            "Roll 1d20+5 for me",
-            tools=[roll_dice],
-            tool_choice="auto"
-        )
 
-        print(f"✅ Client response: {response.text[:200]}...")
-        print(f"✅ Tool was {'called' if 'rolled' in response.text.lower() or '1d20' in response.text else 'NOT called'}")
-        print()
-
-    except Exception as e:
-        print(f"⚠️  Client test failed: {e}")
-        print()
+# Both surfaces go through the same tool-calling check
+TOOL_CALLERS = {
+    "client": _invoke_via_client,
+    "agent": _invoke_via_agent,
+}
 
 
-def test_agent_integration():
-    """Test tool integration with Agent"""
-    print("=== Test Agent Integration ===")
+@requires_openai
+@pytest.mark.parametrize("surface", list(TOOL_CALLERS))
+def test_tool_invocation(surface):
+    """Test tool invocation via the OpenAI client and via an Agent"""
+    print(f"=== Test Tool Invocation ({surface}) ===")
 
     # Get API key from environment
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
-        print("⚠️  OPENAI_API_KEY not found, skipping agent test")
+        print(f"⚠️  OPENAI_API_KEY not found, skipping {surface} test")
         return
 
     try:
-        # Create client
-        client = OpenAIClient(
-            api_key=api_key,
-            model="gpt-4o-mini"
-        )
+        # Shared client, called through the surface under test
+        response = TOOL_CALLERS[surface](shared_openai_client())
+        used_tool = 'rolled' in response.text.lower() or '1d20' in response.text
 
-        # Create agent with dice tool
-        agent = Agent(
-            name="dice_roller",
-            client=client,
-            tools=[roll_dice],
-            system_prompt="You are a D&D dice rolling assistant. When asked to roll dice, use the roll_dice tool."
-        )
-
-        # Test agent with tool
-        response = agent.run("Roll initiative for a goblin (+2 bonus)")
-
-        print(f"✅ Agent response: {response.text[:200]}...")
-        print(f"✅ Agent used tool: {'Yes' if 'rolled' in response.text.lower() or '1d20' in response.text else 'Maybe not'}")
+        print(f"✅ {surface.capitalize()} response: {response.text[:200]}...")
+        print(f"✅ Tool was {'called' if used_tool else 'NOT called'}")
         print()
 
     except Exception as e:
-        print(f"⚠️  Agent test failed: {e}")
+        print(f"⚠️  {surface.capitalize()} test failed: {e}")
         print()
 
 
+@requires_openai
 def test_multi_agent_scenario():
     """Test dice tool in a multi-agent D&D scenario"""
     print("=== Test Multi-Agent D&D Scenario ===")
@@ -122,11 +123,8 @@ def test_multi_agent_scenario():
         return
 
     try:
-        # Create client
-        client = OpenAIClient(
-            api_key=api_key,
-            model="gpt-4o-mini"
-        )
+        # Shared client
+        client = shared_openai_client()
 
         # Create DM agent with dice tool
         dm_agent = Agent(
@@ -164,8 +162,8 @@ def run_integration_tests():
     try:
         test_tool_metadata()
         test_direct_tool_call()
-        test_client_tool_invocation()
-        test_agent_integration()
+        for surface in TOOL_CALLERS:
+            test_tool_invocation(surface)
         test_multi_agent_scenario()
 
         print("="*60)
@@ -10,6 +10,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.config import GROQ_API_KEY, GROQ_MODEL
+from src.http_pool import share_connection_pool
 
 
 def test_groq_connection():
@@ -25,11 +26,11 @@ def test_groq_connection():
 
         print(f"Testing Groq API with model: {GROQ_MODEL}")
 
-        client = OpenAILikeClient(
+        client = share_connection_pool(OpenAILikeClient(
             api_key=GROQ_API_KEY,
             base_url="https://api.groq.com/openai/v1",
             model=GROQ_MODEL
-        )
+        ))
 
         response = client.invoke("Say 'Hello D&D!' and nothing else")
         print(f"✅ Groq API connection successful!")
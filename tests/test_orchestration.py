@@ -32,6 +32,7 @@ from src.orchestration.intents import (
     generate_player_intent
 )
 from src.orchestration.orchestrator import GameOrchestrator
+from tests._llm_cache import cache_client
 
 
 async def test_message_board():
@@ -66,6 +67,19 @@ async def test_message_board():
     assert len(received_messages) == 1
     assert received_messages[0].speaker == "System"
 
+    # Speaker tallies
+    counts = board.speaker_counts()
+    assert counts["DM"] == 1 and counts["System"] == 1 and counts["Player 1"] == 1
+
+    # Test history bound (oldest messages dropped)
+    bounded = MessageBoard(max_history=3)
+    for i in range(5):
+        await bounded.post(Message("DM", f"Message {i}"))
+
+    assert len(bounded) == 3, f"Expected 3 messages, got {len(bounded)}"
+    assert [m.text for m in bounded.get_recent(2)] == ["Message 3", "Message 4"]
+    assert bounded.get_context_window(max_messages=10).startswith("[DM]: Message 2")
+
     print("✅ MessageBoard test passed")
 
 
@@ -79,11 +93,12 @@ async def test_hybrid_memory_system():
         print("⚠️  Skipping HybridMemorySystem test: OPENAI_API_KEY not set")
         return
 
-    client = OpenAIClient(
+    # Calls are replayed from tests/.llm_cache.json on re-runs
+    client = cache_client(OpenAIClient(
         api_key=api_key,
         model="gpt-4o-mini",
         temperature=0.7
-    )
+    ))
 
     dm_agent = Agent(
         name="DM",
@@ -171,6 +186,11 @@ def test_smart_ordering():
     print(f"Order (P1 spoke last): {ordered}")
     # P1 should be penalized, but exact order depends on variety randomness
 
+    # Test top-K cap (P1's relevance lead outweighs the variety factor)
+    ordered = smart_order_players(intents, last_speakers=[], top_k=1)
+    assert ordered == ["P1"], f"top_k=1 should keep only P1, got {ordered}"
+    print(f"Order (top_k=1): {ordered}")
+
     # Test all want to respond = False
     intents_none = [
         PlayerIntent(player_name="P1", wants_to_respond=False, relevance_score=0, reason=""),
@@ -192,11 +212,12 @@ async def test_game_loop():
         return
 
     # Create client
-    client = OpenAIClient(
+    # Calls are replayed from tests/.llm_cache.json on re-runs
+    client = cache_client(OpenAIClient(
         api_key=api_key,
         model="gpt-4o-mini",
         temperature=0.7
-    )
+    ))
 
     # Create DM agent
     dm_agent = Agent(
@@ -273,4 +294,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop schedules the gathered agent calls faster when installed (pip install uvloop)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
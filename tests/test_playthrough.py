@@ -22,12 +22,11 @@ from typing import Dict, List
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from dotenv import load_dotenv
-
 from src.agents.dm_agent import create_dm_agent
 from src.agents.player_agent import create_player_agent
 from src.memory.hybrid_memory import HybridMemorySystem
 from src.orchestration.orchestrator import GameOrchestrator
+from tests import _llm_cache
 
 
 # Character sheets for test playthrough
@@ -68,6 +67,7 @@ class PlaythroughMetrics:
     def __init__(self):
         self.start_time = None
         self.end_time = None
+        self.report_timestamp = ""  # Wall-clock end time shared by report and transcript
         self.total_turns = 0
         self.total_messages = 0
         self.errors: List[str] = []
@@ -79,17 +79,23 @@ class PlaythroughMetrics:
         self.exceptions = 0
 
     def start(self):
-        """Start timing"""
-        self.start_time = time.time()
+        """Start timing (monotonic clock, immune to wall-clock adjustments)"""
+        self.start_time = time.perf_counter()
 
     def stop(self):
-        """Stop timing"""
-        self.end_time = time.time()
+        """Stop timing and record the wall-clock timestamp once"""
+        self.end_time = time.perf_counter()
+        self.report_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    @property
+    def timestamp(self) -> str:
+        """End-of-playthrough timestamp (now, if timing was never stopped)"""
+        return self.report_timestamp or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
     @property
     def duration_seconds(self) -> float:
         """Total duration in seconds"""
-        if not self.start_time or not self.end_time:
+        if self.start_time is None or self.end_time is None:
             return 0.0
         return self.end_time - self.start_time
 
@@ -117,20 +123,32 @@ class PlaythroughMetrics:
         """Record a warning"""
         self.warnings.append(warning)
 
+    async def on_message(self, msg):
+        """Board subscriber: count each message as it is posted"""
+        self.total_messages += 1
+        if msg.speaker == "DM":
+            self.dm_messages += 1
+        elif msg.speaker == "System":
+            self.system_messages += 1
+            if msg.metadata and msg.metadata.get("type") == "error":
+                self.add_error(msg.text)
+        else:
+            self.player_messages += 1
+
     def analyze_messages(self, board):
-        """Analyze messages from message board"""
+        """Analyze messages from a board that was not observed live (see on_message)"""
         self.total_messages = len(board.messages)
 
+        # Counted from the board's speaker column; everyone but DM/System is a player
+        speakers = board.speaker_counts()
+        self.dm_messages = speakers["DM"]
+        self.system_messages = speakers["System"]
+        self.player_messages = self.total_messages - self.dm_messages - self.system_messages
+
+        # Check for errors in system messages
         for msg in board.messages:
-            if msg.speaker == "DM":
-                self.dm_messages += 1
-            elif msg.speaker == "System":
-                self.system_messages += 1
-                # Check for errors in system messages
-                if msg.metadata and msg.metadata.get("type") == "error":
-                    self.add_error(msg.content)
-            else:
-                self.player_messages += 1
+            if msg.speaker == "System" and msg.metadata and msg.metadata.get("type") == "error":
+                self.add_error(msg.text)
 
     def generate_report(self) -> str:
         """Generate human-readable report"""
@@ -138,7 +156,7 @@ class PlaythroughMetrics:
         report.append("=" * 60)
         report.append("PLAYTHROUGH METRICS REPORT")
         report.append("=" * 60)
-        report.append(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        report.append(f"Timestamp: {self.timestamp}")
         report.append("")
 
         report.append("⏱️  TIMING")
@@ -147,6 +165,14 @@ class PlaythroughMetrics:
         report.append(f"  Avg Time/Turn: {self.avg_time_per_turn:.2f}s")
         report.append("")
 
+        report.append("🗄️  LLM CACHE")
+        if _llm_cache.cache_enabled():
+            report.append(f"  Hits: {_llm_cache.stats['hits']}")
+            report.append(f"  Misses: {_llm_cache.stats['misses']}")
+        else:
+            report.append("  Disabled (DISABLE_LLM_CACHE)")
+        report.append("")
+
         report.append("💬 MESSAGES")
         report.append(f"  Total Messages: {self.total_messages}")
         report.append(f"  DM Messages: {self.dm_messages}")
@@ -198,8 +224,7 @@ async def setup_game_system(verbose: bool = True):
     if verbose:
         print("🎲 Setting up game system...")
 
-    # Load environment variables
-    load_dotenv()
+    # Environment variables are loaded once by src.config on import
 
     # 1. Create agents using factory functions
     if verbose:
@@ -215,6 +240,10 @@ async def setup_game_system(verbose: bool = True):
         create_player_agent(CHARACTER_FINN, provider="openai", temperature=0.9)
     ]
 
+    # Replay model calls from tests/.llm_cache.json (DISABLE_LLM_CACHE=1 for live timings)
+    for agent in [dm_agent] + player_agents:
+        _llm_cache.cache_client(agent._client)
+
     # 2. Create memory system
     if verbose:
         print("  🧠 Initializing memory system...")
@@ -255,6 +284,9 @@ async def run_playthrough(max_turns: int = 50, output_file: str = None, verbose:
         # Setup
         orchestrator = await setup_game_system(verbose=verbose)
 
+        # Count messages as they are posted (also those the bounded board later evicts)
+        orchestrator.memory.board.subscribe(metrics.on_message)
+
         # Run game loop
         if verbose:
             print(f"🎮 Starting adventure (max {max_turns} turns)...\n")
@@ -270,9 +302,6 @@ async def run_playthrough(max_turns: int = 50, output_file: str = None, verbose:
         metrics.stop()
         metrics.total_turns = orchestrator.turn_count
 
-        # Analyze messages
-        metrics.analyze_messages(orchestrator.memory.board)
-
         if verbose:
             print("=" * 60)
             print("\n✅ Playthrough complete!\n")
@@ -297,28 +326,28 @@ async def save_transcript(board, output_file: str, metrics: PlaythroughMetrics):
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        # Header
-        f.write("=" * 80 + "\n")
-        f.write("D&D MULTI-AGENT PLAYTHROUGH TRANSCRIPT\n")
-        f.write("=" * 80 + "\n")
-        f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Duration: {metrics.duration_minutes:.1f} minutes\n")
-        f.write(f"Total Turns: {metrics.total_turns}\n")
-        f.write(f"Total Messages: {metrics.total_messages}\n")
-        f.write("\n" + "=" * 80 + "\n\n")
-
-        # Messages
-        for i, msg in enumerate(board.messages, 1):
-            timestamp = msg.metadata.get('timestamp', 'N/A') if msg.metadata else 'N/A'
-            f.write(f"[{i}] {msg.speaker} ({timestamp})\n")
-            f.write("-" * 80 + "\n")
-            f.write(f"{msg.content}\n\n")
-
-        # Footer
-        f.write("\n" + "=" * 80 + "\n")
-        f.write("END OF TRANSCRIPT\n")
-        f.write("=" * 80 + "\n")
+    # Header
+    parts = [
+        "=" * 80 + "\n",
+        "D&D MULTI-AGENT PLAYTHROUGH TRANSCRIPT\n",
+        "=" * 80 + "\n",
+        f"Date: {metrics.timestamp}\n",
+        f"Duration: {metrics.duration_minutes:.1f} minutes\n",
+        f"Total Turns: {metrics.total_turns}\n",
+        f"Total Messages: {metrics.total_messages}\n",
+        "\n" + "=" * 80 + "\n\n",
+    ]
+
+    # Messages
+    for i, msg in enumerate(board.messages, 1):
+        timestamp = msg.metadata.get('timestamp', 'N/A') if msg.metadata else 'N/A'
+        parts.append(f"[{i}] {msg.speaker} ({timestamp})\n{'-' * 80}\n{msg.text}\n\n")
+
+    # Footer
+    parts.append("\n" + "=" * 80 + "\nEND OF TRANSCRIPT\n" + "=" * 80 + "\n")
+
+    # One encode and one write for the whole transcript
+    output_path.write_text("".join(parts), encoding='utf-8')
 
 
 async def main():
@@ -369,4 +398,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop schedules the gathered agent calls faster when installed (pip install uvloop)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,8 +1,11 @@
 """
 Simple RAG test that runs ingestion and retrieval in the same session.
-This is necessary because Qdrant :memory: mode doesn't persist between runs.
+
+Ingestion goes to an on-disk store (QDRANT_TEST_PATH) that is reused while
+the source documents are unchanged, so only the first run pays for embedding.
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -10,9 +13,25 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.config import COLLECTION_ADVENTURE, COLLECTION_MONSTERS, COLLECTION_RULES
+from src.config import COLLECTION_ADVENTURE, COLLECTION_MONSTERS, COLLECTION_RULES, QDRANT_TEST_PATH
 from src.rag.ingestion import ingest_documents
-from src.rag.retrieval import query_adventure, query_monsters, query_rules
+from src.rag.retrieval import a_query_rag
+
+
+async def run_queries(test_queries, vectorstore):
+    """
+    Ask all test queries concurrently.
+
+    Retrieval is micro-batched (one embedding request, one Qdrant batch per
+    collection) and the answer generations overlap.
+
+    Returns:
+        One answer (or exception) per test query, in order
+    """
+    return await asyncio.gather(*(
+        a_query_rag(test['query'], test['collection'], k=test['k'], vectorstore=vectorstore)
+        for test in test_queries
+    ), return_exceptions=True)
 
 
 def main():
@@ -24,7 +43,7 @@ def main():
     # Step 1: Ingest documents
     print("STEP 1: Ingesting documents...")
     print("-"*70)
-    vectorstore = ingest_documents()
+    vectorstore = ingest_documents(storage_path=QDRANT_TEST_PATH)
 
     # Step 2: Test retrieval
     print("\n" + "="*70)
@@ -35,70 +54,67 @@ def main():
         {
             "name": "Rules - Grappling",
             "query": "What are the rules for grappling?",
-            "function": query_rules,
+            "collection": COLLECTION_RULES,
             "k": 3
         },
         {
             "name": "Rules - Fireball",
             "query": "How does the Fireball spell work?",
-            "function": query_rules,
+            "collection": COLLECTION_RULES,
             "k": 3
         },
         {
             "name": "Monster - Goblin",
             "query": "What are goblin stats?",
-            "function": query_monsters,
+            "collection": COLLECTION_MONSTERS,
             "k": 1
         },
         {
             "name": "Adventure - Opening",
             "query": "What is the opening scene of the adventure?",
-            "function": query_adventure,
+            "collection": COLLECTION_ADVENTURE,
             "k": 5
         },
     ]
 
+    answers = asyncio.run(run_queries(test_queries, vectorstore))
+
     results = []
-    for test in test_queries:
+    for test, answer in zip(test_queries, answers):
         print(f"\n{'='*70}")
         print(f"TEST: {test['name']}")
         print(f"Query: {test['query']}")
         print(f"{'='*70}\n")
 
-        try:
-            answer = test['function'](test['query'], k=test['k'], verbose=False, vectorstore=vectorstore)
-            print(f"✅ SUCCESS\n")
-            print(f"Answer ({len(answer)} chars):")
-            print("-"*70)
-            print(answer)
-            print("-"*70)
-            results.append({"test": test['name'], "success": True})
-
-        except Exception as e:
-            print(f"❌ FAILED: {e}\n")
-            results.append({"test": test['name'], "success": False, "error": str(e)})
+        if isinstance(answer, Exception):
+            print(f"❌ FAILED: {answer}\n")
+            results.append({"test": test['name'], "success": False, "error": str(answer)})
+            continue
 
-    # Summary
-    print("\n" + "="*70)
-    print("SUMMARY")
-    print("="*70)
+        print(f"✅ SUCCESS\n")
+        print(f"Answer ({len(answer)} chars):")
+        print("-"*70)
+        print(answer)
+        print("-"*70)
+        results.append({"test": test['name'], "success": True})
 
+    # Summary (built first, written in one go)
     passed = sum(1 for r in results if r.get("success"))
     total = len(results)
 
+    lines = ["\n" + "="*70, "SUMMARY", "="*70]
     for r in results:
         status = "✅" if r.get("success") else "❌"
-        print(f"  {status} {r['test']}")
-
-    print(f"\n{'='*70}")
-    print(f"TOTAL: {passed}/{total} tests passed")
+        lines.append(f"  {status} {r['test']}")
 
+    lines += [f"\n{'='*70}", f"TOTAL: {passed}/{total} tests passed"]
     if passed == total:
-        print("🎉 ALL TESTS PASSED - Phase 2 RAG System Working!")
+        lines.append("🎉 ALL TESTS PASSED - Phase 2 RAG System Working!")
     else:
-        print("⚠️  Some tests failed - Review output above")
+        lines.append("⚠️  Some tests failed - Review output above")
+    lines.append(f"{'='*70}\n")
 
-    print(f"{'='*70}\n")
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -2,34 +2,51 @@
 Test Datapizza AI installation and basic imports
 """
 
-def test_datapizza_imports():
-    """Test that all Datapizza AI imports work correctly"""
+def test_datapizza_core_imports():
+    """Test that the core Datapizza AI imports work correctly"""
     try:
-        # Core imports
         from datapizza.agents import Agent
         from datapizza.memory import Memory
         from datapizza.tools import tool
         from datapizza.type import ROLE, TextBlock
 
-        # Client imports
+        # Pipelines
+        from datapizza.pipeline import IngestionPipeline, DagPipeline
+
+        # Tracing
+        from datapizza.tracing import ContextTracing
+
+        print("✅ Datapizza AI core imports successful!")
+        return True
+    except ImportError as e:
+        print(f"❌ Import error: {e}")
+        return False
+
+
+def test_datapizza_client_imports():
+    """Test that the Datapizza AI client imports work (loads the provider SDKs)"""
+    try:
         from datapizza.clients.openai import OpenAIClient
         from datapizza.clients.google import GoogleClient
         from datapizza.clients.anthropic import AnthropicClient
         from datapizza.clients.openai_like import OpenAILikeClient
 
-        # Embedders & Vectorstores
+        print("✅ Datapizza AI client imports successful!")
+        return True
+    except ImportError as e:
+        print(f"❌ Import error: {e}")
+        return False
+
+
+def test_datapizza_vectorstore_imports():
+    """Test that the Datapizza AI embedder and vectorstore imports work"""
+    try:
         from datapizza.embedders import ChunkEmbedder
         from datapizza.embedders.openai import OpenAIEmbedder
         from datapizza.vectorstores.qdrant import QdrantVectorstore
         from datapizza.core.vectorstore import VectorConfig
 
-        # Pipelines
-        from datapizza.pipeline import IngestionPipeline, DagPipeline
-
-        # Tracing
-        from datapizza.tracing import ContextTracing
-
-        print("✅ All Datapizza AI imports successful!")
+        print("✅ Datapizza AI embedder/vectorstore imports successful!")
         return True
     except ImportError as e:
         print(f"❌ Import error: {e}")
@@ -75,7 +92,9 @@ if __name__ == "__main__":
     print("=" * 50)
 
     results = []
-    results.append(test_datapizza_imports())
+    results.append(test_datapizza_core_imports())
+    results.append(test_datapizza_client_imports())
+    results.append(test_datapizza_vectorstore_imports())
     results.append(test_web_framework_imports())
     results.append(test_pydantic_imports())
 